@@ -0,0 +1,14 @@
+# backend/models/fields.py
+import sys
+
+
+def interned(value):
+    """Interned copy of an enum-like string field, so equal values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def extra_fields(data, known):
+    """Fields a model does not know about, kept so a round trip does not drop them."""
+    if len(data) <= len(known) and all(key in known for key in data):
+        return ()
+    return tuple((key, value) for key, value in data.items() if key not in known)
@@ -0,0 +1,113 @@
+# backend/models/job.py
+from dataclasses import dataclass
+
+from backend.models.fields import extra_fields, interned
+from backend.models.mold import Mold, mold_id_for
+from backend.models.operator import Operator
+
+NOT_STARTED = "Not Started"
+IN_PROGRESS = "In Progress"
+COMPLETED = "Completed"
+STATUSES = (NOT_STARTED, IN_PROGRESS, COMPLETED)
+
+# Mold fields a job keeps as they were when it was created: the name to show
+# if the mold is deleted, and the chemistry the job was planned with.
+# Everything else about the mold is read from the catalog.
+SNAPSHOT_FIELDS = ("mold_name", "chemical_type", "mixing_ratio")
+
+_KNOWN = frozenset(("job_id", "operator", "mold", "mold_id", "part_count",
+                    "start_datetime", "end_datetime", "status", "started_at",
+                    "completed_at") + SNAPSHOT_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """A production job. The mold is referenced by id plus SNAPSHOT_FIELDS."""
+
+    job_id: str
+    mold_id: str = None
+    mold_name: str = None
+    chemical_type: str = None
+    mixing_ratio: str = None
+    operator: Operator = None
+    part_count: int = 0
+    start_datetime: str = None
+    end_datetime: str = None
+    status: str = NOT_STARTED
+    started_at: str = None      # when the job went In Progress
+    completed_at: str = None    # when it was Completed
+    extra: tuple = ()
+
+    @property
+    def parts(self):
+        """part_count as an int (0 when missing or malformed)."""
+        try:
+            return int(self.part_count or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    @classmethod
+    def from_dict(cls, data, molds=None, operators=None):
+        """Build a Job from a job record.
+
+        Older records embed a full copy of their mold; it is reduced to its
+        id and, when a molds dict (mold_id -> Mold) is given, registered
+        there once so jobs of a deleted mold can still be shown. An
+        operators dict deduplicates the operator snapshots the same way.
+        """
+        get = data.get
+        mold_id = get("mold_id")
+        snapshot = data
+        mold = get("mold")
+        if isinstance(mold, dict):
+            if mold_id is None:
+                mold_id = mold_id_for(mold)
+                snapshot = mold
+            if molds is not None and mold_id not in molds:
+                molds[mold_id] = Mold.from_dict(mold, mold_id)
+
+        operator = get("operator")
+        if isinstance(operator, dict):
+            operator = Operator.from_dict(operator)
+            if operators is not None:
+                operator = operators.setdefault(operator, operator)
+
+        return cls(
+            get("job_id"),
+            interned(mold_id),
+            interned(snapshot.get("mold_name")),
+            interned(snapshot.get("chemical_type")),
+            interned(snapshot.get("mixing_ratio")),
+            operator,
+            get("part_count", 0),
+            get("start_datetime"),
+            get("end_datetime"),
+            interned(get("status", NOT_STARTED)),
+            get("started_at"),
+            get("completed_at"),
+            extra_fields(data, _KNOWN),
+        )
+
+    def to_dict(self, mold=None):
+        """Normalized job record; pass a Mold to also embed a full copy
+        (kept only for jobs whose mold is no longer in the catalog)."""
+        data = {
+            "job_id": self.job_id,
+            "operator": self.operator.to_dict() if self.operator else None,
+            "mold_id": self.mold_id,
+            "mold_name": self.mold_name,
+            "chemical_type": self.chemical_type,
+            "mixing_ratio": self.mixing_ratio,
+        }
+        if mold is not None:
+            data["mold"] = mold.to_dict()
+        data["part_count"] = self.part_count
+        data["start_datetime"] = self.start_datetime
+        data["end_datetime"] = self.end_datetime
+        data["status"] = self.status
+        if self.started_at is not None:
+            data["started_at"] = self.started_at
+        if self.completed_at is not None:
+            data["completed_at"] = self.completed_at
+        data.update(self.extra)
+        return data
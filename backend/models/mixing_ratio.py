@@ -0,0 +1,47 @@
+# backend/models/mixing_ratio.py
+from dataclasses import dataclass
+
+from backend.models.fields import interned
+
+RATIO_LETTERS = tuple("ABCDEFGHIJ")
+
+
+@dataclass(frozen=True, slots=True)
+class RatioRange:
+    """Accepted mixing ratio range for one ratio letter."""
+
+    min: float
+    max: float
+
+    def contains(self, value):
+        return self.min <= value <= self.max
+
+
+@dataclass(frozen=True, slots=True)
+class MixingRatios:
+    """One calibration: ratio letter -> RatioRange, as saved by the calibration screen."""
+
+    ranges: tuple  # ((letter, RatioRange), ...) in letter order
+
+    @classmethod
+    def from_dict(cls, data):
+        ranges = []
+        for letter, bounds in data.items():
+            try:
+                ranges.append((interned(letter), RatioRange(float(bounds["min"]), float(bounds["max"]))))
+            except (KeyError, TypeError, ValueError):
+                print(f"Skipping invalid mixing ratio {letter!r}: {bounds!r}")
+        return cls(tuple(sorted(ranges)))
+
+    def to_dict(self):
+        return {letter: {"min": r.min, "max": r.max} for letter, r in self.ranges}
+
+    def get(self, letter):
+        for key, r in self.ranges:
+            if key == letter:
+                return r
+        return None
+
+    def contains(self, letter, value):
+        r = self.get(letter)
+        return r is not None and r.contains(value)
@@ -0,0 +1,69 @@
+# backend/models/mold.py
+from dataclasses import dataclass
+
+from backend.models.fields import extra_fields, interned
+
+FIELDS = (
+    "vehicle", "system", "mold_name", "mold_type", "mold_number", "life_span",
+    "part_number", "creation_type", "mixing_ratio", "chemical_type", "timestamp"
+)
+# Written only when set; older mold files do not have them
+OPTIONAL_FIELDS = ("mixing_ratio", "chemical_type", "timestamp")
+_KNOWN = frozenset(FIELDS + ("mold_id",))
+
+
+def mold_id_for(data):
+    """Id of a mold record: the mold_id stored in it since molds get one at
+    creation, else the storage key CreateMoldScreen used to derive."""
+    if data.get("mold_id"):
+        return interned(data["mold_id"])
+    name = data.get("mold_name")
+    timestamp = data.get("timestamp")
+    return interned(f"{name}_{timestamp}" if timestamp else name)
+
+
+@dataclass(frozen=True, slots=True)
+class Mold:
+    """A mold definition, keyed by its storage key (mold_id)."""
+
+    mold_id: str
+    vehicle: str = None
+    system: str = None
+    mold_name: str = None
+    mold_type: str = None
+    mold_number: str = None
+    life_span: int = 0
+    part_number: str = None
+    creation_type: str = None
+    mixing_ratio: str = None
+    chemical_type: str = None
+    timestamp: str = None
+    extra: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data, mold_id=None):
+        get = data.get
+        return cls(
+            mold_id if mold_id is not None else mold_id_for(data),
+            interned(get("vehicle")),
+            interned(get("system")),
+            interned(get("mold_name")),
+            interned(get("mold_type")),
+            get("mold_number"),
+            get("life_span", 0),
+            get("part_number"),
+            interned(get("creation_type")),
+            interned(get("mixing_ratio")),
+            interned(get("chemical_type")),
+            get("timestamp"),
+            extra_fields(data, _KNOWN),
+        )
+
+    def to_dict(self):
+        data = {"mold_id": self.mold_id}
+        for name in FIELDS:
+            value = getattr(self, name)
+            if value is not None or name not in OPTIONAL_FIELDS:
+                data[name] = value
+        data.update(self.extra)
+        return data
@@ -0,0 +1,45 @@
+# backend/models/operator.py
+from dataclasses import dataclass
+
+from backend.models.fields import extra_fields, interned
+
+ROLES = ("Operator", "Supervisor")
+_KNOWN = frozenset(("username", "name", "epf_number", "role", "password_hash"))
+
+
+@dataclass(frozen=True, slots=True)
+class Operator:
+    """An operator account, or the operator snapshot stored on a job (no hash)."""
+
+    username: str
+    name: str = None
+    epf_number: str = None
+    role: str = None
+    password_hash: str = None
+    extra: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        get = data.get
+        return cls(
+            interned(get("username")),
+            interned(get("name")),
+            get("epf_number"),
+            interned(get("role")),
+            get("password_hash"),
+            extra_fields(data, _KNOWN),
+        )
+
+    def to_dict(self):
+        data = {"username": self.username, "name": self.name,
+                "epf_number": self.epf_number, "role": self.role}
+        if self.password_hash is not None:
+            data["password_hash"] = self.password_hash
+        data.update(self.extra)
+        return data
+
+    def as_assignee(self):
+        """The fields a job keeps about the operator it was assigned to."""
+        if self.password_hash is None and not self.extra:
+            return self
+        return Operator(self.username, self.name, self.epf_number, self.role)
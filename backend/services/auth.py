@@ -0,0 +1,113 @@
+# backend/services/auth.py
+import hashlib
+import hmac
+import os
+
+from backend.services.file_handler import get_storage
+
+PBKDF2_ITERATIONS = 200_000
+HASH_SCHEME = "pbkdf2_sha256"
+
+
+def hash_password(password, salt=None, iterations=PBKDF2_ITERATIONS):
+    """Salted PBKDF2 hash in the form scheme$iterations$salt$hash (hex)."""
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{HASH_SCHEME}${iterations}${salt.hex()}${digest.hex()}"
+
+
+def check_password(password, encoded):
+    # a damaged or hand-edited hash is a failed login, not an error
+    try:
+        scheme, iterations, salt, expected = encoded.split("$")
+        if scheme != HASH_SCHEME:
+            return False
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), int(iterations))
+        return hmac.compare_digest(digest.hex(), expected)
+    except (AttributeError, ValueError, TypeError):
+        return False
+
+
+class AuthService:
+    """Operator login against an in-memory username -> record map.
+
+    The map follows the operator store through its storage snapshot, so a
+    login only rescans what changed. The PBKDF2 check runs once per
+    operator and password; after that a keyed fast digest of the password
+    is cached until the operator record changes, which keeps repeated
+    badge-ins at shift change sub-millisecond.
+
+    Records still holding a plaintext "password" are upgraded to a
+    "password_hash" on their first successful login.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.snapshot = storage.snapshot("operators")
+        self.operators = {}                 # username -> operator record
+        self._verified = {}                 # username -> fast digest of the accepted password
+        self._cache_key = os.urandom(32)    # never persisted; cache dies with the process
+
+    def sync(self):
+        """Apply operator changes since the last sync."""
+        changes = self.snapshot.scan()
+        if not changes:
+            return
+        for username in changes.removed:
+            self.operators.pop(username, None)
+            self._verified.pop(username, None)
+        changed = changes.added + changes.modified
+        records = self.storage.load_many("operators", changed)
+        for username in changed:
+            self._verified.pop(username, None)
+            if username in records:
+                self.operators[username] = records[username]
+            else:
+                self.operators.pop(username, None)
+
+    def _fast_digest(self, password):
+        return hmac.new(self._cache_key, password.encode(), hashlib.sha256).digest()
+
+    def verify(self, username, password):
+        """Return the operator record if the credentials are valid, else None."""
+        self.sync()
+        operator = self.operators.get(username)
+        if operator is None or not password:
+            return None
+
+        fast = self._fast_digest(password)
+        cached = self._verified.get(username)
+        if cached is not None:
+            return operator if hmac.compare_digest(cached, fast) else None
+
+        if "password_hash" in operator:
+            ok = check_password(password, operator["password_hash"])
+        else:
+            # bytes: compare_digest rejects str with non-ASCII characters
+            ok = hmac.compare_digest(str(operator.get("password", "")).encode("utf-8"),
+                                     password.encode("utf-8"))
+            if ok:
+                operator = self._upgrade(operator, password)
+        if ok:
+            self._verified[username] = fast
+            return operator
+        return None
+
+    def _upgrade(self, operator, password):
+        """Replace a legacy plaintext password with a salted hash."""
+        upgraded = {k: v for k, v in operator.items() if k != "password"}
+        upgraded["password_hash"] = hash_password(password)
+        self.storage.save("operators", operator["username"], upgraded)
+        self.sync()
+        return self.operators.get(operator["username"], upgraded)
+
+
+_auth = None
+
+
+def get_auth_service():
+    """Shared AuthService over the shared storage."""
+    global _auth
+    if _auth is None:
+        _auth = AuthService(get_storage())
+    return _auth
@@ -0,0 +1,130 @@
+# backend/services/calibration_repository.py
+import bisect
+from datetime import datetime
+
+from backend.models.mixing_ratio import MixingRatios
+from backend.services.file_handler import ChangeSet, get_storage
+
+KEY_PREFIX = "calibration_"
+KEY_TIME_FORMAT = "%Y%m%d_%H%M%S"   # as CalibrationMachineScreen names its saves
+
+
+def calibration_time(key):
+    """Save time encoded in a calibration key, or None for foreign keys."""
+    if not key.startswith(KEY_PREFIX):
+        return None
+    try:
+        return datetime.strptime(key[len(KEY_PREFIX):], KEY_TIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def _as_datetime(when):
+    if isinstance(when, str):
+        return datetime.fromisoformat(when)
+    return when
+
+
+class CalibrationRepository:
+    """Every saved calibration as MixingRatios, ordered by save time.
+
+    A calibration applies from the moment it was saved until the next one,
+    so current is the last entry and at(T) is a binary search over the save
+    times. refresh() only reads the calibrations the storage snapshot
+    reports as changed.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.snapshot = storage.snapshot("calibration")
+        self.times = []         # save times, ascending
+        self.entries = []       # (key, MixingRatios) in the same order
+        self.loaded = False
+
+    # ---------------- Loading ----------------
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.loaded = True
+            self.refresh()
+
+    def refresh(self):
+        return self._apply(self.snapshot.scan())
+
+    def apply_changes(self, changes):
+        """Apply a ChangeSet of calibration keys reported by the data watcher."""
+        if not self.loaded:
+            return ChangeSet([], [], [])
+        return self._apply(self.snapshot.restat(changes))
+
+    def _apply(self, changes):
+        records = self.storage.load_many("calibration", changes.added + changes.modified)
+        for key in changes.removed + changes.modified:
+            self._remove(key)
+        for key in changes.added + changes.modified:
+            saved_at = calibration_time(key)
+            if saved_at is None:
+                print(f"Ignoring calibration with no save time in its name: {key}")
+            elif key in records:
+                self._insert(saved_at, key, MixingRatios.from_dict(records[key]))
+        return changes
+
+    def _find(self, key):
+        saved_at = calibration_time(key)
+        if saved_at is None:
+            return None
+        i = bisect.bisect_left(self.times, saved_at)
+        while i < len(self.times) and self.times[i] == saved_at:
+            if self.entries[i][0] == key:
+                return i
+            i += 1
+        return None
+
+    def _insert(self, saved_at, key, ratios):
+        i = bisect.bisect_right(self.times, saved_at)
+        self.times.insert(i, saved_at)
+        self.entries.insert(i, (key, ratios))
+
+    def _remove(self, key):
+        i = self._find(key)
+        if i is not None:
+            del self.times[i]
+            del self.entries[i]
+
+    # ---------------- Queries ----------------
+    @property
+    def current(self):
+        """The latest calibration (MixingRatios), or None if none was saved."""
+        return self.entries[-1][1] if self.entries else None
+
+    def at(self, when):
+        """Calibration in force at a datetime or ISO string, or None before the first."""
+        i = bisect.bisect_right(self.times, _as_datetime(when)) - 1
+        return self.entries[i][1] if i >= 0 else None
+
+    def history(self):
+        """(save time, key, MixingRatios) oldest first."""
+        return [(t, key, ratios) for t, (key, ratios) in zip(self.times, self.entries)]
+
+    def range_for_job(self, job):
+        """RatioRange of a job's mixing ratio in the calibration it ran under."""
+        when = job.started_at or job.start_datetime
+        if not when or not job.mixing_ratio:
+            return None
+        try:
+            ratios = self.at(when)
+        except ValueError:
+            return None
+        return ratios.get(job.mixing_ratio) if ratios else None
+
+
+_repository = None
+
+
+def get_calibration_repository(load=True):
+    """Shared CalibrationRepository over the shared storage, loaded on first use."""
+    global _repository
+    if _repository is None:
+        _repository = CalibrationRepository(get_storage())
+    if load:
+        _repository.ensure_loaded()
+    return _repository
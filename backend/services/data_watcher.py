@@ -0,0 +1,86 @@
+# backend/services/data_watcher.py
+import os
+
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+from backend.services.file_handler import KINDS, get_storage
+
+# Poll every kind, for data folders on network shares where no watcher events arrive
+POLL_ALL = os.environ.get("RIMWORKS_POLL", "") not in ("", "0")
+
+
+class DataWatcher(QObject):
+    """Pushes per-record changes in the shared storage to the screens.
+
+    QFileSystemWatcher marks a kind dirty when one of its storage paths
+    changes (the JSON folders, or the SQLite database and its WAL) and a
+    single-shot timer debounces bursts of writes before the kind's storage
+    snapshot is rescanned. A polling timer rescans only the kinds whose
+    paths could not be watched, or every kind with poll_all (RIMWORKS_POLL=1)
+    for shared network folders, where no watcher events arrive.
+    """
+
+    # kind ("jobs", "molds", ...), ChangeSet of record keys
+    changed = pyqtSignal(str, object)
+
+    def __init__(self, storage=None, kinds=KINDS, debounce_ms=250, poll_ms=5000, poll_all=POLL_ALL, parent=None):
+        super().__init__(parent)
+        self.storage = storage or get_storage()
+        self.kinds = tuple(kinds)
+        self.snapshots = {}
+        self._dirty = set()
+        self._by_path = {}
+        self._polled = set()
+
+        for kind in self.kinds:
+            snapshot = self.storage.snapshot(kind)
+            snapshot.scan()  # baseline; screens load their own data first
+            self.snapshots[kind] = snapshot
+            for path in self.storage.watch_paths(kind):
+                self._by_path.setdefault(path, set()).add(kind)
+
+        # Debounce: restart on every event, scan once the writes settle
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self.flush)
+
+        self.fs_watcher = QFileSystemWatcher(self)
+        failed = self.fs_watcher.addPaths(list(self._by_path))
+        if failed:
+            print(f"File watcher unavailable for {failed}, polling instead.")
+        self.fs_watcher.directoryChanged.connect(self._on_path_changed)
+        self.fs_watcher.fileChanged.connect(self._on_path_changed)
+
+        # Polling fallback, started only for kinds that need it
+        self._poll = QTimer(self)
+        self._poll.setInterval(poll_ms)
+        self._poll.timeout.connect(self.poll)
+        self._poll_kinds(self.kinds if poll_all else [k for path in failed for k in self._by_path[path]])
+
+    def _poll_kinds(self, kinds):
+        self._polled.update(kinds)
+        if self._polled and not self._poll.isActive():
+            self._poll.start()
+
+    def _on_path_changed(self, path):
+        kinds = self._by_path.get(path)
+        if kinds:
+            self._dirty.update(kinds)
+            self._debounce.start()
+        # some platforms drop a watched file once it is replaced
+        if path not in self.fs_watcher.files() + self.fs_watcher.directories():
+            if not self.fs_watcher.addPath(path):
+                self._poll_kinds(kinds or ())
+
+    def poll(self):
+        self._dirty.update(self._polled)
+        self.flush()
+
+    def flush(self):
+        """Rescan the dirty kinds and emit one ChangeSet per changed kind."""
+        dirty, self._dirty = self._dirty, set()
+        for kind in dirty:
+            changes = self.snapshots[kind].scan()
+            if changes:
+                self.changed.emit(kind, changes)
@@ -0,0 +1,125 @@
+# backend/services/dispense_validation.py
+from dataclasses import dataclass
+
+import numpy as np
+
+from backend.models.mixing_ratio import RATIO_LETTERS
+
+_LETTER_BASE = ord(RATIO_LETTERS[0])
+
+
+def letter_codes(letters):
+    """Ratio letters ("A".."J", as str/bytes arrays or lists) -> int codes 0..9; -1 if unknown."""
+    letters = np.asarray(letters)
+    if letters.dtype.kind in "iu":
+        codes = letters.astype(np.int64)
+    elif letters.dtype.kind == "U":
+        codes = letters.astype("U1").view(np.uint32).astype(np.int64) - _LETTER_BASE
+    elif letters.dtype.kind == "S":
+        codes = letters.astype("S1").view(np.uint8).astype(np.int64) - _LETTER_BASE
+    else:
+        codes = np.array([ord(str(l)[:1] or "\0") for l in letters], dtype=np.int64) - _LETTER_BASE
+    codes[(codes < 0) | (codes >= len(RATIO_LETTERS))] = -1
+    return codes
+
+
+def as_datetime64(timestamps):
+    """Timestamps (datetime64, ISO strings or datetimes) -> datetime64[s]."""
+    return np.asarray(timestamps, dtype="datetime64[s]")
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Per-reading masks for one batch of dispense readings."""
+
+    codes: np.ndarray          # ratio letter code of each reading (-1 unknown)
+    values: np.ndarray
+    passed: np.ndarray         # within the band of the calibration in force
+    below: np.ndarray
+    above: np.ndarray
+    uncalibrated: np.ndarray   # unknown letter, no calibration yet, or letter not calibrated
+
+    @property
+    def failed(self):
+        return ~self.passed
+
+    def summary(self):
+        """Counts overall and per ratio letter, with the mean measured value."""
+        n = len(RATIO_LETTERS)
+        known = self.codes >= 0
+        codes = self.codes[known]
+        total = np.bincount(codes, minlength=n)
+        passed = np.bincount(codes, weights=self.passed[known], minlength=n).astype(np.int64)
+        value_sum = np.bincount(codes, weights=self.values[known], minlength=n)
+        per_letter = {
+            letter: {
+                "readings": int(total[i]),
+                "passed": int(passed[i]),
+                "failed": int(total[i] - passed[i]),
+                "mean_value": float(value_sum[i] / total[i]) if total[i] else None,
+            }
+            for i, letter in enumerate(RATIO_LETTERS) if total[i]
+        }
+        count = len(self.values)
+        n_passed = int(np.count_nonzero(self.passed))
+        return {
+            "readings": count,
+            "passed": n_passed,
+            "failed": count - n_passed,
+            "below": int(np.count_nonzero(self.below)),
+            "above": int(np.count_nonzero(self.above)),
+            "uncalibrated": int(np.count_nonzero(self.uncalibrated)),
+            "pass_rate": n_passed / count if count else None,
+            "per_letter": per_letter,
+        }
+
+
+class DispenseValidator:
+    """Checks dispense readings against the calibration in force when each was taken.
+
+    The calibration history is laid out once as a sorted array of save
+    times and (snapshot x letter) min/max tables. A batch is then checked
+    in a handful of NumPy operations: searchsorted picks each reading's
+    snapshot, fancy indexing fetches its band, and two comparisons give the
+    masks. Letters missing from a snapshot have NaN bounds and never pass.
+    """
+
+    def __init__(self, history):
+        """history: (save time, MixingRatios) pairs or (save time, key, MixingRatios) triples."""
+        entries = sorted(((entry[0], entry[-1]) for entry in history), key=lambda e: e[0])
+        n = len(RATIO_LETTERS)
+        self.times = np.array([t for t, _ in entries], dtype="datetime64[s]")
+        self.mins = np.full((len(entries), n), np.nan)
+        self.maxs = np.full((len(entries), n), np.nan)
+        for row, (_, ratios) in enumerate(entries):
+            for letter, r in ratios.ranges:
+                col = ord(letter) - _LETTER_BASE
+                if 0 <= col < n:
+                    self.mins[row, col] = r.min
+                    self.maxs[row, col] = r.max
+
+    @classmethod
+    def from_repository(cls, repository):
+        return cls(repository.history())
+
+    def validate(self, letters, values, timestamps):
+        """Validate one batch; the three inputs are parallel sequences/arrays."""
+        codes = letter_codes(letters)
+        values = np.asarray(values, dtype=np.float64)
+        snapshot = np.searchsorted(self.times, as_datetime64(timestamps), side="right") - 1
+
+        usable = (codes >= 0) & (snapshot >= 0)
+        lo = np.full(values.shape, np.nan)
+        hi = np.full(values.shape, np.nan)
+        lo[usable] = self.mins[snapshot[usable], codes[usable]]
+        hi[usable] = self.maxs[snapshot[usable], codes[usable]]
+
+        uncalibrated = np.isnan(lo) | np.isnan(hi)
+        below = values < lo        # False where lo is NaN
+        above = values > hi
+        passed = ~(uncalibrated | below | above)
+        return ValidationResult(codes, values, passed, below, above, uncalibrated)
+
+    def validate_batches(self, batches):
+        """Validate (letters, values, timestamps) batches one after another."""
+        return [self.validate(*batch) for batch in batches]
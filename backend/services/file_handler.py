@@ -0,0 +1,797 @@
+# backend/services/file_handler.py
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+from backend.services.instrumentation import count, timed
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Data kinds every storage backend holds
+KINDS = ("molds", "jobs", "operators", "calibration")
+
+# Fields the screens filter and group on, per kind (column -> extractor).
+# SQLite stores these as indexed columns; the JSON backend filters on them in memory.
+INDEXED_COLUMNS = {
+    "molds": {
+        "vehicle": lambda r: r.get("vehicle"),
+        "system": lambda r: r.get("system"),
+        "mold_type": lambda r: r.get("mold_type"),
+        "chemical_type": lambda r: r.get("chemical_type"),
+        "mixing_ratio": lambda r: r.get("mixing_ratio"),
+        "created_at": lambda r: r.get("created_at"),
+        "part_number": lambda r: r.get("part_number"),
+    },
+    "jobs": {
+        "status": lambda r: r.get("status"),
+        "chemical_type": lambda r: r.get("chemical_type") or (r.get("mold") or {}).get("chemical_type"),
+        "operator": lambda r: (r.get("operator") or {}).get("username"),
+        "start_datetime": lambda r: r.get("start_datetime"),
+    },
+    "operators": {
+        "role": lambda r: r.get("role"),
+    },
+    "calibration": {},
+}
+
+
+def list_json_files(folder):
+    """Return the names of the .json files in a folder (empty if it is missing)."""
+    if not os.path.isdir(folder):
+        return []
+    return [f for f in os.listdir(folder) if f.endswith(".json")]
+
+
+@timed("json.read")
+def read_json(path):
+    """Load one JSON document, returning None if it is missing or malformed."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Failed to read {path}: {e}")
+        count("json.read_failed")
+        return None
+
+
+def write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def write_json_atomic(path, data, fsync=True):
+    """Write JSON to a temp file in the same folder, fsync it (unless
+    fsync=False), then rename it over path, so readers never see a
+    half-written file."""
+    folder = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json_batch(files, exclusive=False):
+    """Atomically replace several JSON files (path -> data) with one
+    directory fsync per folder: every temp file is written and fsynced,
+    then all are renamed into place and each folder is synced once.
+
+    exclusive=True never replaces a file: each temp file is hard-linked to
+    its path instead, which fails if the path exists. Returns the paths
+    skipped that way.
+    """
+    written = []
+    existing = []
+    try:
+        for path, data in files.items():
+            folder = os.path.dirname(path) or "."
+            fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=".json")
+            written.append((tmp_path, path))
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+        for tmp_path, path in written:
+            if not exclusive:
+                os.replace(tmp_path, path)
+                continue
+            try:
+                os.link(tmp_path, path)
+            except FileExistsError:
+                existing.append(path)
+            os.remove(tmp_path)
+    except BaseException:
+        for tmp_path, _ in written:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+    if hasattr(os, "O_DIRECTORY"):  # the renames themselves; not possible on Windows
+        for folder in {os.path.dirname(path) or "." for path in files}:
+            fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+    return existing
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive lock on a lock file, shared by threads and processes
+    (and terminals on the same data folder)."""
+    with open(path, "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RecordExists(Exception):
+    """save_many(..., create=True) found records already stored under these keys."""
+
+    def __init__(self, keys):
+        super().__init__(f"already stored: {', '.join(keys)}")
+        self.keys = list(keys)
+
+
+class ChangeSet(namedtuple("ChangeSet", "added modified removed")):
+    """Keys added, modified and removed between two scans."""
+
+    def __bool__(self):
+        return bool(self.added or self.modified or self.removed)
+
+
+class DirectorySnapshot:
+    """Remembers (mtime, size) of every file in a folder with a given suffix.
+
+    scan() only stats the directory entries and reports which keys (file
+    names without the suffix) were added, modified or removed since the
+    previous scan, so callers reparse just the files that changed.
+    """
+
+    def __init__(self, folder, suffix=".json"):
+        self.folder = folder
+        self.suffix = suffix
+        self.entries = {}  # key -> (mtime_ns, size)
+
+    def _stat_all(self):
+        current = {}
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if entry.name.endswith(self.suffix) and entry.is_file():
+                        st = entry.stat()
+                        current[entry.name[:-len(self.suffix)]] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return current
+
+    @timed("scan.directory")
+    def scan(self):
+        """Restat the folder and return a ChangeSet against the previous scan."""
+        current = self._stat_all()
+        previous = self.entries
+        added = [k for k in current if k not in previous]
+        modified = [k for k, sig in current.items() if k in previous and previous[k] != sig]
+        removed = [k for k in previous if k not in current]
+        self.entries = current
+        return ChangeSet(added, modified, removed)
+
+    def restat(self, changes):
+        """Restat just the keys of a ChangeSet reported by another scanner.
+
+        Returns the part of it not already recorded here, so a consumer can
+        apply events from the data watcher without seeing them twice.
+        """
+        added, modified, removed = [], [], []
+        for key in dict.fromkeys(changes.added + changes.modified + changes.removed):
+            previous = self.entries.get(key)
+            try:
+                st = os.stat(self.path(key))
+                current = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                current = None
+            if current == previous:
+                continue
+            if current is None:
+                del self.entries[key]
+                removed.append(key)
+            else:
+                self.entries[key] = current
+                (added if previous is None else modified).append(key)
+        return ChangeSet(added, modified, removed)
+
+    def path(self, key):
+        return os.path.join(self.folder, key + self.suffix)
+
+
+# ---------------- Operator journal ----------------
+class OperatorJournal:
+    """Operators as a snapshot array plus an append-only JSON Lines journal.
+
+    operators.json stays the snapshot (the original format) and every save
+    appends one line per record to operators.jsonl, so a save costs O(1)
+    instead of rewriting the whole array. refresh() replays only the
+    journal bytes it has not read yet. Once the journal grows past
+    COMPACT_BYTES it is folded into a new snapshot on a background thread.
+    All file access holds operators.lock, so concurrent saves from several
+    terminals never lose records.
+    """
+
+    COMPACT_BYTES = 256 * 1024
+
+    def __init__(self, folder):
+        self.snapshot_file = os.path.join(folder, "operators.json")
+        self.journal_file = os.path.join(folder, "operators.jsonl")
+        self.lock_file = os.path.join(folder, "operators.lock")
+        self.records = {}          # username -> operator dict
+        self.version = 0           # bumped whenever records change
+        self._snapshot_sig = None  # (mtime_ns, size, inode) of the snapshot last read
+        self._offset = 0           # journal bytes already replayed
+        self._mutex = threading.Lock()
+        self._compactor = None
+        # the watcher needs the journal to exist before it can watch it
+        open(self.journal_file, "a").close()
+
+    @staticmethod
+    def _signature(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    @staticmethod
+    def _read_snapshot(path):
+        data = read_json(path) if os.path.exists(path) else []
+        if not isinstance(data, list):
+            print("Operators file has unexpected structure — ignoring.")
+            return {}
+        return {op["username"]: op for op in data if isinstance(op, dict) and "username" in op}
+
+    @staticmethod
+    def _replay(records, chunk):
+        """Apply complete journal lines; returns the number of bytes consumed."""
+        end = chunk.rfind(b"\n") + 1  # a torn last line is left for later
+        for line in chunk[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("op") == "delete":
+                records.pop(entry.get("username"), None)
+            elif isinstance(entry.get("record"), dict) and "username" in entry["record"]:
+                records[entry["record"]["username"]] = entry["record"]
+        return end
+
+    @timed("journal.refresh")
+    def refresh(self):
+        """Bring records up to date, reading only journal bytes not yet seen."""
+        with file_lock(self.lock_file), self._mutex:
+            self._refresh_locked()
+        return self.records
+
+    def _refresh_locked(self):
+        sig = self._signature(self.snapshot_file)
+        journal_size = os.path.getsize(self.journal_file) if os.path.exists(self.journal_file) else 0
+        changed = False
+        records = self.records
+        if sig != self._snapshot_sig or journal_size < self._offset:
+            # first load, or compacted by another terminal
+            records = self._read_snapshot(self.snapshot_file)
+            self._snapshot_sig = sig
+            self._offset = 0
+            changed = True
+        if journal_size > self._offset:
+            with open(self.journal_file, "rb") as f:
+                f.seek(self._offset)
+                consumed = self._replay(records, f.read())
+            if consumed:
+                self._offset += consumed
+                changed = True
+        if changed:
+            self.records = records
+            self.version += 1
+
+    def append(self, records=(), deletes=()):
+        """Durably journal operator records (dicts) and deleted usernames."""
+        lines = [json.dumps({"op": "put", "record": r}) + "\n" for r in records]
+        lines += [json.dumps({"op": "delete", "username": u}) + "\n" for u in deletes]
+        if not lines:
+            return
+        with file_lock(self.lock_file), self._mutex:
+            with open(self.journal_file, "a") as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+            self._refresh_locked()
+            journal_size = self._offset
+        if journal_size > self.COMPACT_BYTES:
+            self.compact_in_background()
+
+    def compact(self):
+        """Fold the journal into a fresh snapshot and truncate it."""
+        with file_lock(self.lock_file):
+            records = self._read_snapshot(self.snapshot_file)
+            if os.path.exists(self.journal_file):
+                with open(self.journal_file, "rb") as f:
+                    self._replay(records, f.read())
+            write_json_atomic(self.snapshot_file, list(records.values()))
+            open(self.journal_file, "w").close()
+            with self._mutex:
+                self.records = records
+                self._snapshot_sig = self._signature(self.snapshot_file)
+                self._offset = 0
+                self.version += 1
+
+    def compact_in_background(self):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="operator-compactor", daemon=True)
+        self._compactor.start()
+
+
+class JournalSnapshot:
+    """Change tracking for the operator journal, keyed by username."""
+
+    def __init__(self, journal):
+        self.journal = journal
+        self.version = None
+        self.records = {}
+
+    @timed("scan.journal")
+    def scan(self):
+        current = self.journal.refresh()
+        if self.journal.version == self.version:
+            return ChangeSet([], [], [])
+        previous = self.records
+        added = [u for u in current if u not in previous]
+        modified = [u for u, r in current.items() if u in previous and previous[u] != r]
+        removed = [u for u in previous if u not in current]
+        self.records = dict(current)
+        self.version = self.journal.version
+        return ChangeSet(added, modified, removed)
+
+    def restat(self, changes):
+        return self.scan()
+
+
+# ---------------- Storage backends ----------------
+class Storage:
+    """Keyed record store for molds, jobs, operators and calibrations.
+
+    Records are plain dicts. Keys are the mold/job/calibration file names
+    without .json and operator usernames. root is the data folder, where
+    side files such as the job archive live. snapshot(kind) returns an object
+    whose scan() reports the keys changed since the previous scan, which
+    is what the mold catalog, job table and data watcher are built on.
+    """
+
+    def load(self, kind, key):
+        raise NotImplementedError
+
+    def load_many(self, kind, keys):
+        """dict key -> record for the keys that exist."""
+        records = {}
+        for key in keys:
+            record = self.load(kind, key)
+            if record is not None:
+                records[key] = record
+        return records
+
+    def load_all(self, kind):
+        raise NotImplementedError
+
+    def save(self, kind, key, record, durable=False, create=False):
+        self.save_many(kind, {key: record}, durable, create)
+
+    def save_many(self, kind, records, durable=False, create=False):
+        """Store records (key -> record). durable=True also makes the batch
+        atomic and flushed to disk before returning (see JobWriter).
+        create=True stores only records whose key is free and then raises
+        RecordExists for the others, instead of replacing them."""
+        raise NotImplementedError
+
+    def keys(self, kind, prefix=""):
+        """Stored keys of a kind that start with prefix."""
+        raise NotImplementedError
+
+    def delete(self, kind, key):
+        raise NotImplementedError
+
+    def reserve_sequence(self, name, count=1, start=None):
+        """Atomically advance the named counter by count and return the first
+        value of the reserved block (counters start at 1).
+
+        The new high-water mark is durable before this returns, so a value is
+        never handed out twice, even across crashes and terminals; values of a
+        block that is never used are simply skipped. A counter that does not
+        exist yet starts after start() when given (the last value already in
+        use, e.g. in ids stored before the counters were).
+        """
+        raise NotImplementedError
+
+    def raise_sequence(self, name, value):
+        """Move the named counter up to value (never down), e.g. when
+        importing counters; returns the counter's new value."""
+        raise NotImplementedError
+
+    def sequences(self):
+        """name -> current value of every counter."""
+        raise NotImplementedError
+
+    def query(self, kind, **equals):
+        """Records whose indexed columns equal the given values."""
+        columns = INDEXED_COLUMNS[kind]
+        return {
+            key: record for key, record in self.load_all(kind).items()
+            if all(columns[col](record) == value for col, value in equals.items())
+        }
+
+    def snapshot(self, kind):
+        raise NotImplementedError
+
+    def watch_paths(self, kind):
+        """Paths whose changes mean records of this kind may have changed."""
+        raise NotImplementedError
+
+
+class JsonStorage(Storage):
+    """The original layout: one pretty-printed file per mold, job and
+    calibration; operators in operators.json plus its OperatorJournal."""
+
+    def __init__(self, root="data"):
+        self.root = root
+        self.folders = {kind: os.path.join(root, kind) for kind in KINDS}
+        for folder in self.folders.values():
+            os.makedirs(folder, exist_ok=True)
+        self.operators = OperatorJournal(self.folders["operators"])
+        self.sequences_file = os.path.join(root, "sequences.json")
+        self.sequences_lock = os.path.join(root, "sequences.lock")
+
+    def _path(self, kind, key):
+        return os.path.join(self.folders[kind], key + ".json")
+
+    def load(self, kind, key):
+        if kind == "operators":
+            return self.operators.refresh().get(key)
+        path = self._path(kind, key)
+        if not os.path.exists(path):
+            return None
+        data = read_json(path)
+        return data if isinstance(data, dict) else None
+
+    def load_all(self, kind):
+        if kind == "operators":
+            return dict(self.operators.refresh())
+        keys = [f[:-len(".json")] for f in list_json_files(self.folders[kind])]
+        return self.load_many(kind, keys)
+
+    def save_many(self, kind, records, durable=False, create=False):
+        if kind == "operators":
+            self.operators.append(records.values())  # the journal always fsyncs
+            return
+        if create:
+            paths = {self._path(kind, key): key for key in records}
+            existing = write_json_batch({path: records[key] for path, key in paths.items()}, exclusive=True)
+            if existing:
+                raise RecordExists([paths[path] for path in existing])
+            return
+        if durable:
+            write_json_batch({self._path(kind, key): record for key, record in records.items()})
+            return
+        for key, record in records.items():
+            # renamed into place: the folder changes, so DataWatcher sees it
+            write_json_atomic(self._path(kind, key), record, fsync=False)
+
+    def keys(self, kind, prefix=""):
+        if kind == "operators":
+            return [key for key in self.operators.refresh() if key.startswith(prefix)]
+        return [f[:-len(".json")] for f in list_json_files(self.folders[kind]) if f.startswith(prefix)]
+
+    def delete(self, kind, key):
+        if kind == "operators":
+            if key in self.operators.refresh():
+                self.operators.append(deletes=[key])
+            return
+        path = self._path(kind, key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def reserve_sequence(self, name, count=1, start=None):
+        with file_lock(self.sequences_lock):
+            sequences = self.sequences()
+            last = sequences.get(name)
+            if last is None:
+                last = start() if start else 0
+            sequences[name] = last + count
+            write_json_atomic(self.sequences_file, sequences)
+        return last + 1
+
+    def raise_sequence(self, name, value):
+        with file_lock(self.sequences_lock):
+            sequences = self.sequences()
+            sequences[name] = max(sequences.get(name, 0), value)
+            write_json_atomic(self.sequences_file, sequences)
+        return sequences[name]
+
+    def sequences(self):
+        if not os.path.exists(self.sequences_file):
+            return {}
+        sequences = read_json(self.sequences_file)
+        if not isinstance(sequences, dict):
+            # never restart a counter from a damaged file
+            raise OSError(f"Cannot read sequences from {self.sequences_file}")
+        return sequences
+
+    def snapshot(self, kind):
+        if kind == "operators":
+            return JournalSnapshot(self.operators)
+        return DirectorySnapshot(self.folders[kind])
+
+    def watch_paths(self, kind):
+        if kind == "operators":
+            # appends do not touch the folder, so watch the journal too
+            return [self.folders[kind], self.operators.journal_file]
+        return [self.folders[kind]]
+
+
+class SqliteSnapshot:
+    """Change tracking for SqliteStorage through its changes log."""
+
+    def __init__(self, storage, kind):
+        self.storage = storage
+        self.kind = kind
+        self.last_seq = None
+        self.keys = set()
+
+    @timed("scan.sqlite")
+    def scan(self):
+        conn = self.storage.connection()
+        if self.last_seq is None:
+            self.last_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+            self.keys = {row[0] for row in conn.execute(f"SELECT key FROM {self.kind}")}
+            return ChangeSet(list(self.keys), [], [])
+
+        rows = conn.execute(
+            "SELECT seq, key FROM changes WHERE kind = ? AND seq > ? ORDER BY seq",
+            (self.kind, self.last_seq),
+        ).fetchall()
+        if not rows:
+            return ChangeSet([], [], [])
+        self.last_seq = rows[-1][0]
+        touched = list(dict.fromkeys(key for _, key in rows))
+        present = self.storage.existing(self.kind, touched)
+
+        added, modified, removed = [], [], []
+        for key in touched:
+            if key in present:
+                (modified if key in self.keys else added).append(key)
+                self.keys.add(key)
+            elif key in self.keys:
+                removed.append(key)
+                self.keys.discard(key)
+        return ChangeSet(added, modified, removed)
+
+    def restat(self, changes):
+        # The log already says exactly what this snapshot has not seen yet
+        return self.scan()
+
+
+class SqliteStorage(Storage):
+    """Single-file SQLite database in WAL mode.
+
+    Each kind is a table holding the record as JSON plus indexed columns
+    for INDEXED_COLUMNS. Every write also appends to a changes log, which
+    SqliteSnapshot reads to report changed keys without scanning tables.
+    """
+
+    def __init__(self, path="data/rimworks.db"):
+        self.path = path
+        self.root = os.path.dirname(path) or "."
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._local = threading.local()
+        self._create_schema()
+
+    def connection(self):
+        """One connection per thread (sqlite3 connections are not shareable)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self):
+        conn = self.connection()
+        with conn:
+            for kind in KINDS:
+                columns = "".join(f", {col} TEXT" for col in INDEXED_COLUMNS[kind])
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {kind} (key TEXT PRIMARY KEY{columns}, data TEXT NOT NULL)")
+                for col in INDEXED_COLUMNS[kind]:
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{kind}_{col} ON {kind} ({col})")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS changes "
+                "(seq INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, key TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_changes_kind_seq ON changes (kind, seq)")
+            conn.execute("CREATE TABLE IF NOT EXISTS sequences (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def load(self, kind, key):
+        row = self.connection().execute(f"SELECT data FROM {kind} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @timed("sqlite.load_many")
+    def load_many(self, kind, keys):
+        keys = list(keys)
+        records = {}
+        conn = self.connection()
+        # stay under SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for key, data in conn.execute(f"SELECT key, data FROM {kind} WHERE key IN ({marks})", chunk):
+                records[key] = json.loads(data)
+        return records
+
+    @timed("sqlite.load_all")
+    def load_all(self, kind):
+        return {key: json.loads(data) for key, data in self.connection().execute(f"SELECT key, data FROM {kind}")}
+
+    def existing(self, kind, keys):
+        conn = self.connection()
+        present = set()
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            present.update(row[0] for row in conn.execute(f"SELECT key FROM {kind} WHERE key IN ({marks})", chunk))
+        return present
+
+    def save_many(self, kind, records, durable=False, create=False):
+        columns = INDEXED_COLUMNS[kind]
+        names = ", ".join(["key", *columns, "data"])
+        marks = ",".join("?" * (len(columns) + 2))
+        rows = [
+            (key, *(extract(record) for extract in columns.values()), json.dumps(record))
+            for key, record in records.items()
+        ]
+        conn = self.connection()
+        if durable:
+            # NORMAL may lose the last commits on power loss; FULL syncs the WAL on commit
+            conn.execute("PRAGMA synchronous=FULL")
+        existing = []
+        try:
+            with conn:
+                if create:
+                    # one statement per row, so each key is checked and taken atomically
+                    written = []
+                    for row in rows:
+                        cursor = conn.execute(f"INSERT OR IGNORE INTO {kind} ({names}) VALUES ({marks})", row)
+                        (written if cursor.rowcount else existing).append(row[0])
+                else:
+                    conn.executemany(f"INSERT OR REPLACE INTO {kind} ({names}) VALUES ({marks})", rows)
+                    written = list(records)
+                conn.executemany("INSERT INTO changes (kind, key) VALUES (?, ?)", [(kind, key) for key in written])
+        finally:
+            if durable:
+                conn.execute("PRAGMA synchronous=NORMAL")
+        if existing:
+            raise RecordExists(existing)
+
+    def delete(self, kind, key):
+        conn = self.connection()
+        with conn:
+            if conn.execute(f"DELETE FROM {kind} WHERE key = ?", (key,)).rowcount:
+                conn.execute("INSERT INTO changes (kind, key) VALUES (?, ?)", (kind, key))
+
+    def keys(self, kind, prefix=""):
+        cursor = self.connection().execute(
+            f"SELECT key FROM {kind} WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+        return [row[0] for row in cursor]
+
+    def reserve_sequence(self, name, count=1, start=None):
+        conn = self.connection()
+        with conn:
+            # the insert takes the write lock, so start() runs at most once per counter
+            if conn.execute("INSERT OR IGNORE INTO sequences (name, value) VALUES (?, 0)", (name,)).rowcount:
+                conn.execute("UPDATE sequences SET value = ? WHERE name = ?", (start() if start else 0, name))
+            conn.execute("UPDATE sequences SET value = value + ? WHERE name = ?", (count, name))
+            last = conn.execute("SELECT value FROM sequences WHERE name = ?", (name,)).fetchone()[0]
+        return last - count + 1
+
+    def raise_sequence(self, name, value):
+        conn = self.connection()
+        with conn:
+            conn.execute(
+                "INSERT INTO sequences (name, value) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = max(value, excluded.value)",
+                (name, value),
+            )
+            return conn.execute("SELECT value FROM sequences WHERE name = ?", (name,)).fetchone()[0]
+
+    def sequences(self):
+        return dict(self.connection().execute("SELECT name, value FROM sequences"))
+
+    def query(self, kind, **equals):
+        for col in equals:
+            if col not in INDEXED_COLUMNS[kind]:
+                raise ValueError(f"{kind} has no indexed column {col!r}")
+        where = " AND ".join(f"{col} = ?" for col in equals) or "1"
+        cursor = self.connection().execute(f"SELECT key, data FROM {kind} WHERE {where}", tuple(equals.values()))
+        return {key: json.loads(data) for key, data in cursor}
+
+    def snapshot(self, kind):
+        return SqliteSnapshot(self, kind)
+
+    def watch_paths(self, kind):
+        # WAL mode writes land in the -wal file first
+        return [self.path, self.path + "-wal"]
+
+
+_storage = None
+
+
+def get_storage():
+    """Shared storage backend.
+
+    RIMWORKS_STORAGE=sqlite selects SQLite (database at RIMWORKS_DB, default
+    data/rimworks.db); otherwise JSON files under RIMWORKS_DATA (default data).
+    """
+    global _storage
+    if _storage is None:
+        if os.environ.get("RIMWORKS_STORAGE", "json").lower() == "sqlite":
+            _storage = SqliteStorage(os.environ.get("RIMWORKS_DB", "data/rimworks.db"))
+        else:
+            _storage = JsonStorage(os.environ.get("RIMWORKS_DATA", "data"))
+    return _storage
+
+
+def import_json_tree(json_root="data", db_path="data/rimworks.db"):
+    """One-shot import of the JSON data tree into a SQLite database."""
+    source = JsonStorage(json_root)
+    target = SqliteStorage(db_path)
+    counts = {}
+    for kind in KINDS:
+        records = source.load_all(kind)
+        target.save_many(kind, records)
+        counts[kind] = len(records)
+    # carry the id counters over, or the allocators would hand out the imported ids again;
+    # raised rather than added to, so importing twice changes nothing
+    for name, value in source.sequences().items():
+        target.raise_sequence(name, value)
+    counts["sequences"] = len(source.sequences())
+    return counts
+
+
+if __name__ == "__main__":
+    # python -m backend.services.file_handler [json_root] [db_path]
+    counts = import_json_tree(*sys.argv[1:3])
+    for kind, n in counts.items():
+        print(f"Imported {n} {kind}")
@@ -0,0 +1,144 @@
+# backend/services/id_allocator.py
+import os
+import re
+import threading
+from datetime import date
+
+from backend.services.file_handler import get_storage
+
+# Ids reserved from storage at a time; the rest of a block is handed out from memory
+BLOCK_SIZE = 10
+
+
+def station_prefix(name):
+    """Station name reduced to characters that are safe in a file name."""
+    return re.sub(r"[^A-Za-z0-9]+", "", name or "").upper()
+
+
+class IdAllocator:
+    """Hands out record ids like JOB-20261018-0042 (or JOB-ST2-20261018-0042
+    with a station prefix), numbered by one counter per prefix, day and
+    station.
+
+    Counters live in the storage backend (Storage.reserve_sequence), which
+    persists each reservation before returning it; a counter that is
+    missing starts after the highest id already stored for the day. The allocator reserves
+    a block of block_size ids at once and serves the rest from memory, so
+    most ids cost no I/O and terminals sharing a data folder only meet on
+    the counter once per block. prefetch() reserves the next block on a
+    background thread, so a screen that calls it ahead of time never
+    waits for storage in next_id(). Ids are unique and increase per
+    terminal; ids of a block left unused when the app closes or crashes
+    are skipped, never reused.
+    """
+
+    def __init__(self, storage, kind="jobs", prefix="JOB", station="", block_size=BLOCK_SIZE):
+        self.storage = storage
+        self.kind = kind
+        self.prefix = prefix
+        self.station = station_prefix(station)
+        self.block_size = max(1, block_size)
+        self._lock = threading.Condition()
+        self._day = None
+        self._next = self._end = 0  # current block is [_next, _end)
+        self._spare = None          # (day, first, end) of a block reserved by prefetch()
+        self._fetching = False
+
+    def _prefix(self, day):
+        parts = [self.prefix, self.station, day.strftime("%Y%m%d")]
+        return "-".join(p for p in parts if p)
+
+    def _sequence(self, day):
+        return f"{self.kind}/{self._prefix(day)}"
+
+    def _highest(self, day):
+        """Highest number already used in a stored id for the day (0 if none)."""
+        prefix = self._prefix(day) + "-"
+        numbers = [key[len(prefix):] for key in self.storage.keys(self.kind, prefix)]
+        return max((int(n) for n in numbers if n.isdigit()), default=0)
+
+    def _reserve_block(self, day, size):
+        # a missing counter (lost or never imported) starts after the stored ids
+        return self.storage.reserve_sequence(self._sequence(day), size, start=lambda: self._highest(day))
+
+    def prefetch(self, today=None):
+        """Reserve the next block on a background thread, unless ids for the
+        day are already at hand or being fetched."""
+        day = today or date.today()
+        with self._lock:
+            at_hand = self._day == day and self._next < self._end
+            if at_hand or self._fetching or (self._spare and self._spare[0] == day):
+                return
+            self._fetching = True
+        threading.Thread(target=self._fetch, args=(day,), name=f"{self.kind}-ids", daemon=True).start()
+
+    def _fetch(self, day):
+        try:
+            first = self._reserve_block(day, self.block_size)
+        except Exception as e:
+            print(f"Failed to reserve {self.kind} ids: {e}")
+            first = None
+        with self._lock:
+            if first is not None:
+                self._spare = (day, first, first + self.block_size)
+            self._fetching = False
+            self._lock.notify_all()
+
+    def reserve(self, count, today=None):
+        """count fresh ids in increasing order (one storage write at most)."""
+        day = today or date.today()
+        with self._lock:
+            if day != self._day:
+                self._day = day
+                self._next = self._end = 0  # the old block belongs to another day's counter
+            ids = []
+            while len(ids) < count:
+                if self._next >= self._end:
+                    # wait for a prefetch in flight rather than reserving past it
+                    self._lock.wait_for(lambda: not self._fetching)
+                    spare, self._spare = self._spare, None
+                    if spare and spare[0] == day:
+                        _, self._next, self._end = spare
+                    else:
+                        size = max(self.block_size, count - len(ids))
+                        self._next = self._reserve_block(day, size)
+                        self._end = self._next + size
+                take = min(count - len(ids), self._end - self._next)
+                prefix = self._prefix(day)
+                ids.extend(f"{prefix}-{n:04d}" for n in range(self._next, self._next + take))
+                self._next += take
+            return ids
+
+    def next_id(self, today=None):
+        return self.reserve(1, today)[0]
+
+
+# kind -> (id prefix, block size); molds are created rarely, so they take
+# one id at a time and leave no gaps
+ALLOCATORS = {"jobs": ("JOB", BLOCK_SIZE), "molds": ("MOLD", 1)}
+
+_allocators = {}
+
+
+def allocator_for(storage, kind):
+    """A new allocator for kind over the given storage. RIMWORKS_STATION sets
+    the station prefix (e.g. ST2) for terminals that should number on their own."""
+    prefix, block_size = ALLOCATORS[kind]
+    return IdAllocator(storage, kind, prefix, os.environ.get("RIMWORKS_STATION", ""), block_size)
+
+
+def _shared(kind):
+    allocator = _allocators.get(kind)
+    if allocator is None:
+        allocator = _allocators[kind] = allocator_for(get_storage(), kind)
+    return allocator
+
+
+def get_job_ids():
+    """Shared job id allocator (JOB-...) over the shared storage."""
+    return _shared("jobs")
+
+
+def get_mold_ids():
+    """Shared mold id allocator (MOLD-...) over the shared storage."""
+    return _shared("molds")
@@ -0,0 +1,199 @@
+# backend/services/instrumentation.py
+"""Hot-path timers and counters.
+
+Off unless RIMWORKS_METRICS=1. When off, @timed returns the function
+unchanged and measure() hands back one shared no-op context manager, so
+instrumented code runs as if it were not instrumented.
+
+When on, every timed operation keeps its last WINDOW durations (ns) for
+p50/p95/p99, plus a total count. start_metrics_dump() appends a snapshot
+as one JSON line every interval to RIMWORKS_METRICS_DUMP, by default
+<data folder>/metrics/<host>.jsonl, so each floor terminal reports into
+the shared data folder.
+"""
+import contextlib
+import functools
+import json
+import os
+import socket
+import threading
+import time
+from collections import Counter, deque
+
+ENABLED = os.environ.get("RIMWORKS_METRICS", "") not in ("", "0")
+WINDOW = 1024
+
+
+class Metrics:
+    """Rolling duration windows and counters per operation name (thread-safe)."""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.samples = {}       # name -> deque of durations in ns
+        self.calls = Counter()  # name -> calls since start
+        self.counters = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, name, ns):
+        with self.lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(ns)
+            self.calls[name] += 1
+
+    def increment(self, name, n=1):
+        with self.lock:
+            self.counters[name] += n
+
+    def snapshot(self):
+        """{"timings": name -> count/p50/p95/p99/max in ms, "counters": name -> n}."""
+        with self.lock:
+            windows = {name: sorted(samples) for name, samples in self.samples.items()}
+            calls = dict(self.calls)
+            counters = dict(self.counters)
+        timings = {}
+        for name, values in windows.items():
+            last = len(values) - 1
+            timings[name] = {
+                "count": calls[name],
+                "p50_ms": values[last * 50 // 100] / 1e6,
+                "p95_ms": values[last * 95 // 100] / 1e6,
+                "p99_ms": values[last * 99 // 100] / 1e6,
+                "max_ms": values[last] / 1e6,
+            }
+        return {"timings": timings, "counters": counters}
+
+
+metrics = Metrics()
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        metrics.record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+_NO_TIMER = contextlib.nullcontext()
+
+
+if ENABLED:
+    def timed(name):
+        """Decorator recording each call's duration under name."""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    metrics.record(name, time.perf_counter_ns() - start)
+            return wrapper
+        return decorate
+
+    def measure(name):
+        """Context manager recording the duration of its block under name."""
+        return _Timer(name)
+
+    def count(name, n=1):
+        metrics.increment(name, n)
+else:
+    def timed(name):
+        return lambda fn: fn
+
+    def measure(name):
+        return _NO_TIMER
+
+    def count(name, n=1):
+        pass
+
+
+def dump_path():
+    path = os.environ.get("RIMWORKS_METRICS_DUMP")
+    if path:
+        return path
+    root = os.environ.get("RIMWORKS_DATA", "data")
+    return os.path.join(root, "metrics", f"{socket.gethostname()}.jsonl")
+
+
+def write_snapshot(path=None):
+    """Append one timestamped snapshot line to the metrics dump."""
+    path = path or dump_path()
+    line = json.dumps({
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "host": socket.gethostname(),
+        "pid": os.getpid(),
+        **metrics.snapshot(),
+    })
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        print(f"Failed to write metrics to {path}: {e}")
+
+
+_dumper = None
+
+
+def start_metrics_dump(interval_s=60, path=None):
+    """Dump a snapshot every interval_s seconds on a daemon thread (no-op when disabled)."""
+    global _dumper
+    if not ENABLED or _dumper is not None:
+        return
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval_s):
+            write_snapshot(path)
+
+    _dumper = threading.Thread(target=run, name="metrics-dump", daemon=True)
+    _dumper.stop = stop
+    _dumper.start()
+
+
+def latest_snapshots(folder=None):
+    """The newest snapshot line of every *.jsonl dump in folder, keyed by file name."""
+    folder = folder or os.path.dirname(dump_path())
+    latest = {}
+    try:
+        names = sorted(n for n in os.listdir(folder) if n.endswith(".jsonl"))
+    except OSError:
+        return latest
+    for name in names:
+        last = None
+        try:
+            with open(os.path.join(folder, name), encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        last = line
+            if last:
+                latest[name[:-len(".jsonl")]] = json.loads(last)
+        except (OSError, ValueError) as e:
+            print(f"Failed to read metrics from {name}: {e}")
+    return latest
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show the latest timings reported by every terminal.")
+    parser.add_argument("folder", nargs="?", help="metrics folder (default: <data folder>/metrics)")
+    args = parser.parse_args()
+    for terminal, snap in latest_snapshots(args.folder).items():
+        print(f"== {terminal} ({snap.get('time')}, pid {snap.get('pid')})")
+        print(f"{'operation':<32} {'n':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        timings = sorted(snap.get("timings", {}).items(), key=lambda kv: -kv[1]["p95_ms"])
+        for name, t in timings:
+            print(f"{name:<32} {t['count']:>7} {t['p50_ms']:>8.2f} {t['p95_ms']:>8.2f} {t['p99_ms']:>8.2f}")
+        for name, n in sorted(snap.get("counters", {}).items()):
+            print(f"{name:<32} {n:>7}")
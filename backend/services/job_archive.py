@@ -0,0 +1,239 @@
+# backend/services/job_archive.py
+import gzip
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+
+from backend.models.job import COMPLETED, Job
+from backend.services.file_handler import file_lock, get_storage, read_json, write_json_atomic
+from backend.services.schedule_index import parse_time
+
+# Completed jobs finished longer ago than this move to the archive
+ARCHIVE_AFTER_DAYS = int(os.environ.get("RIMWORKS_ARCHIVE_DAYS", "90"))
+
+# Shard of jobs without a usable start date
+UNDATED = "undated"
+
+# Per-segment totals kept in the index: summary field -> job -> value
+SUMMARY_FIELDS = {
+    "status": lambda job: job.status,
+    "chemical_type": lambda job: job.chemical_type or "Unknown",
+    "mold": lambda job: job.mold_id or "",
+}
+
+
+def archive_folder(storage):
+    return os.path.join(storage.root, "archive", "jobs")
+
+
+def shard_of(record):
+    """Start month of a job record ("2025-09"), the archive's partition key."""
+    start = parse_time(record.get("start_datetime"))
+    return start.strftime("%Y-%m") if start else UNDATED
+
+
+def finished_at(record):
+    """When a job was completed (its planned end for older records)."""
+    return parse_time(record.get("completed_at")) or parse_time(record.get("end_datetime"))
+
+
+class JobArchive:
+    """Completed job history in compressed, append-only monthly segments.
+
+    Each start month is one <month>.jsonl.gz file. An archive run appends
+    one more gzip member to it (readers see the members as one stream) and
+    never rewrites what is there. index.json holds a small summary per
+    segment: its committed size, job counts per status, chemical type and
+    mold, parts per mold and the range of start times. Queries read the
+    index and open only the segments whose summaries can contain a match.
+
+    Appends are crash-safe: the index is written (atomically) after the
+    segment is synced, and bytes past the size it records are an
+    unfinished append that the next append cuts off and readers ignore.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.index_file = os.path.join(folder, "index.json")
+        self.lock_file = os.path.join(folder, "archive.lock")
+        self._index = {}
+        self._signature = None
+
+    def _segment_path(self, shard):
+        return os.path.join(self.folder, f"{shard}.jsonl.gz")
+
+    # ---------------- Index ----------------
+    def index(self):
+        """shard -> segment summary, re-read only when index.json changed."""
+        try:
+            st = os.stat(self.index_file)
+        except OSError:
+            self._index, self._signature = {}, None
+            return self._index
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature != self._signature:
+            data = read_json(self.index_file)
+            self._index = data if isinstance(data, dict) else {}
+            self._signature = signature
+        return self._index
+
+    def totals(self, field):
+        """Counter summed over every segment, e.g. totals("status")."""
+        total = Counter()
+        for summary in self.index().values():
+            total.update(summary.get(field, {}))
+        return total
+
+    def segments(self, status=None, chemical_type=None, mold_id=None, start=None, end=None):
+        """Shards whose summaries allow a job matching every given filter
+        (start/end bound the job's start time, as ISO strings)."""
+        shards = []
+        for shard, summary in sorted(self.index().items()):
+            if status and status not in summary["status"]:
+                continue
+            if chemical_type and chemical_type not in summary["chemical_type"]:
+                continue
+            if mold_id and mold_id not in summary["mold"]:
+                continue
+            if start and (summary["last_start"] or "") < start:
+                continue
+            if end and (summary["first_start"] or "") > end:
+                continue
+            shards.append(shard)
+        return shards
+
+    # ---------------- Reading ----------------
+    def _read_segment(self, shard):
+        size = self.index()[shard]["size"]
+        try:
+            with open(self._segment_path(shard), "rb") as f:
+                data = f.read(size)
+        except OSError as e:
+            print(f"Failed to read archive segment {shard}: {e}")
+            return
+        for line in gzip.decompress(data).splitlines():
+            entry = json.loads(line)
+            yield entry["key"], entry["job"]
+
+    def keys(self, shard):
+        """Keys already archived in one shard."""
+        if shard not in self.index():
+            return set()
+        return {key for key, _ in self._read_segment(shard)}
+
+    def jobs(self, status=None, chemical_type=None, mold_id=None, start=None, end=None):
+        """(key, record) of archived jobs matching every given filter."""
+        for shard in self.segments(status, chemical_type, mold_id, start, end):
+            for key, record in self._read_segment(shard):
+                job = Job.from_dict(record)
+                if status and job.status != status:
+                    continue
+                if chemical_type and SUMMARY_FIELDS["chemical_type"](job) != chemical_type:
+                    continue
+                if mold_id and job.mold_id != mold_id:
+                    continue
+                if start and (job.start_datetime or "") < start:
+                    continue
+                if end and (job.start_datetime or "") > end:
+                    continue
+                yield key, record
+
+    # ---------------- Appending ----------------
+    def append(self, records):
+        """Add job records (key -> record) to their monthly segments."""
+        shards = {}
+        for key, record in records.items():
+            shards.setdefault(shard_of(record), {})[key] = record
+        os.makedirs(self.folder, exist_ok=True)
+        with file_lock(self.lock_file):
+            self._signature = None  # another terminal may have appended
+            index = dict(self.index())
+            for shard, group in sorted(shards.items()):
+                index[shard] = self._append_segment(shard, group, index.get(shard))
+            write_json_atomic(self.index_file, index)
+
+    def _append_segment(self, shard, records, summary):
+        summary = summary or {"size": 0, "jobs": 0, "first_start": None, "last_start": None,
+                              "parts": {}, **{field: {} for field in SUMMARY_FIELDS}}
+        lines = []
+        parts = Counter(summary["parts"])
+        counts = {field: Counter(summary[field]) for field in SUMMARY_FIELDS}
+        starts = [s for s in (summary["first_start"], summary["last_start"]) if s]
+        for key, record in records.items():
+            lines.append(json.dumps({"key": key, "job": record}))
+            job = Job.from_dict(record)
+            for field, value_of in SUMMARY_FIELDS.items():
+                counts[field][value_of(job)] += 1
+            parts[job.mold_id or ""] += job.parts
+            if job.start_datetime:
+                starts.append(job.start_datetime)
+
+        member = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+        path = self._segment_path(shard)
+        with open(path, "ab") as f:
+            if f.tell() > summary["size"]:
+                f.truncate(summary["size"])  # left over from an append that never committed
+                f.seek(summary["size"])
+            f.write(member)
+            f.flush()
+            os.fsync(f.fileno())
+
+        return {
+            "size": summary["size"] + len(member),
+            "jobs": summary["jobs"] + len(records),
+            "first_start": min(starts) if starts else None,
+            "last_start": max(starts) if starts else None,
+            "parts": dict(parts),
+            **{field: dict(counter) for field, counter in counts.items()},
+        }
+
+
+def archive_completed(storage=None, archive=None, days=ARCHIVE_AFTER_DAYS, now=None, dry_run=False):
+    """Move jobs completed more than `days` ago from storage to the archive.
+
+    Records are appended (and the index committed) before they are deleted,
+    so a crash in between leaves a job in both places rather than neither;
+    the next run only deletes those. Returns the number of jobs archived
+    per shard.
+    """
+    storage = storage or get_storage()
+    archive = archive or JobArchive(archive_folder(storage))
+    cutoff = (now or datetime.now()) - timedelta(days=days)
+    old = {}
+    for key, record in storage.query("jobs", status=COMPLETED).items():
+        finished = finished_at(record)
+        if finished is not None and finished.replace(tzinfo=None) < cutoff:
+            old[key] = record
+    archived = set()
+    for shard in {shard_of(record) for record in old.values()}:
+        archived |= archive.keys(shard)
+    fresh = {key: record for key, record in old.items() if key not in archived}
+    moved = Counter(shard_of(record) for record in fresh.values())
+    if old and not dry_run:
+        if fresh:
+            archive.append(fresh)
+        for key in old:
+            storage.delete("jobs", key)
+    return moved
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Move old completed jobs into the compressed job archive.")
+    parser.add_argument("--days", type=int, default=ARCHIVE_AFTER_DAYS,
+                        help=f"archive jobs completed more than this many days ago (default {ARCHIVE_AFTER_DAYS})")
+    parser.add_argument("--dry-run", action="store_true", help="count only, move nothing")
+    parser.add_argument("--list", action="store_true", help="show the segment summaries instead")
+    args = parser.parse_args()
+    if args.list:
+        archive = JobArchive(archive_folder(get_storage()))
+        for shard, summary in sorted(archive.index().items()):
+            print(f"{shard}: {summary['jobs']} jobs, {summary['size'] / 1024:.1f} KiB, "
+                  f"{summary['first_start']} - {summary['last_start']}")
+    else:
+        moved = archive_completed(days=args.days, dry_run=args.dry_run)
+        for shard, n in sorted(moved.items()):
+            print(f"{shard}: {n} jobs")
+        print(f"{sum(moved.values())} jobs {'to archive' if args.dry_run else 'archived'}.")
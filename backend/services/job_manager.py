@@ -0,0 +1,227 @@
+# backend/services/job_manager.py
+import weakref
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime
+
+from backend.models.job import COMPLETED, IN_PROGRESS, NOT_STARTED
+from backend.services.file_handler import ChangeSet, get_storage
+from backend.services.instrumentation import timed
+from backend.services.job_archive import JobArchive, archive_folder
+from backend.services.job_records import JobResolver
+from backend.services.job_writer import JobWriter
+from backend.services.mold_usage import MoldUsageLedger
+from backend.services.schedule_index import ScheduleIndex
+
+# status -> the only status it may move to
+TRANSITIONS = {NOT_STARTED: IN_PROGRESS, IN_PROGRESS: COMPLETED}
+
+# aggregate name -> value a job is counted under
+DIMENSIONS = {
+    "status": lambda job: job.status,
+    "chemical_type": lambda job: job.chemical_type or "Unknown",
+    "operator": lambda job: job.operator.username if job.operator else None,
+    "mold": lambda job: job.mold_id,
+}
+
+
+class InvalidTransition(ValueError):
+    pass
+
+
+class JobManager:
+    """Owns the job records, their status transitions and running aggregates.
+
+    Jobs move Not Started -> In Progress -> Completed only, and each move
+    stamps started_at / completed_at. Counters per status, chemical type,
+    operator and mold are patched as single jobs are added, changed or
+    removed, so dashboards read them in O(1) instead of rescanning. The
+    parts of completed jobs are booked against their mold in self.usage,
+    and the windows of open jobs are indexed in self.schedule.
+
+    Only live jobs are loaded; completed jobs moved to self.archive are
+    represented by its segment summaries, which keep their parts booked
+    against the molds and give the archived totals per status.
+
+    Like MoldCatalog, refresh() applies what the storage snapshot reports
+    and hands the ChangeSet of job keys to every listener. Jobs are
+    written through self.writer (save()), off the GUI thread.
+    """
+
+    def __init__(self, storage, resolver=None):
+        self.storage = storage
+        self.resolver = resolver or JobResolver()
+        self.jobs = {}                                         # key -> Job
+        self.counts = {name: Counter() for name in DIMENSIONS}  # dimension -> value -> jobs
+        self.usage = MoldUsageLedger(self.resolver.catalog)
+        self.schedule = ScheduleIndex()
+        self.snapshot = storage.snapshot("jobs")
+        self.writer = JobWriter(storage)
+        self.writer.rejected.connect(self._rejected)
+        self.archive = JobArchive(archive_folder(storage))
+        self.archived_parts = Counter()                        # mold id -> parts in the archive
+        self._listeners = []
+        self.loaded = False
+
+    # ---------------- Loading ----------------
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.resolver.catalog.ensure_loaded()
+            self.loaded = True
+            self.sync_archive()
+            self.refresh()
+
+    def refresh(self):
+        """Pick up jobs added, changed or removed since the last scan."""
+        return self._apply(self.snapshot.scan())
+
+    def apply_changes(self, changes):
+        """Apply a ChangeSet of job keys reported by the data watcher."""
+        if not self.loaded:
+            return ChangeSet([], [], [])
+        return self._apply(self.snapshot.restat(changes))
+
+    @timed("job_manager.apply")
+    def _apply(self, changes):
+        added, modified, removed = [], [], []
+        records = self.storage.load_many("jobs", changes.added + changes.modified)
+        for key in changes.removed:
+            if key in self.jobs:
+                self._remove(key)
+                removed.append(key)
+        for key in changes.added + changes.modified:
+            existed = key in self.jobs
+            record = records.get(key)
+            if record is not None:
+                self._put(key, self.resolver.load(record))
+                (modified if existed else added).append(key)
+            elif existed:
+                self._remove(key)
+                removed.append(key)
+        if removed:
+            self.sync_archive()  # removed jobs may have been archived
+        applied = ChangeSet(added, modified, removed)
+        if applied:
+            self._notify(applied)
+            self.usage.notify()
+        return applied
+
+    def sync_archive(self):
+        """Book the archived parts per mold, adjusting by what changed since
+        the last call (the archive index is only re-read when it changed)."""
+        parts = self.archive.totals("parts")
+        for mold_id in set(parts) | set(self.archived_parts):
+            self.usage.add(mold_id, parts[mold_id] - self.archived_parts[mold_id])
+        self.archived_parts = parts
+
+    def archived(self, status=None):
+        """Number of archived jobs (with one status)."""
+        totals = self.archive.totals("status")
+        return totals[status] if status else sum(totals.values())
+
+    def save(self, key, record, create=False):
+        """Queue a job record for the background writer and apply it at once,
+        so counters, the schedule and listeners see it before it is on disk
+        (the later scan of the written file only reloads the same record).
+        create=True saves a new job, which is never written over an existing
+        one (see _rejected)."""
+        self.writer.save(key, record, create)
+        if not self.loaded:
+            return
+        existed = key in self.jobs
+        self._put(key, self.resolver.load(record))
+        self._notify(ChangeSet([], [key], []) if existed else ChangeSet([key], [], []))
+        self.usage.notify()
+
+    def _rejected(self, keys):
+        """New jobs the writer refused because the key was taken: replace
+        what save() applied with the stored records."""
+        if self.loaded:
+            self._apply(ChangeSet([], keys, []))
+
+    # ---------------- Listeners ----------------
+    def subscribe(self, listener):
+        """Call listener(changes) after every refresh that changed something."""
+        ref = weakref.WeakMethod(listener) if hasattr(listener, "__self__") else (lambda: listener)
+        self._listeners.append(ref)
+
+    def _notify(self, changes):
+        alive = []
+        for ref in self._listeners:
+            listener = ref()
+            if listener is not None:
+                alive.append(ref)
+                listener(changes)
+        self._listeners = alive
+
+    # ---------------- Aggregates ----------------
+    def _put(self, key, job):
+        if key in self.jobs:
+            self._remove(key)
+        self.jobs[key] = job
+        for name, value_of in DIMENSIONS.items():
+            self.counts[name][value_of(job)] += 1
+        if job.status == COMPLETED:
+            self.usage.add(job.mold_id, job.parts)
+        else:
+            self.schedule.add(key, job)
+
+    def _remove(self, key):
+        job = self.jobs.pop(key)
+        for name, value_of in DIMENSIONS.items():
+            counter = self.counts[name]
+            value = value_of(job)
+            counter[value] -= 1
+            if not counter[value]:
+                del counter[value]
+        if job.status == COMPLETED:
+            self.usage.add(job.mold_id, -job.parts)
+        else:
+            self.schedule.remove(key)
+
+    def count(self, dimension, value):
+        """Number of jobs with a value in one dimension, e.g. count("status", "Completed")."""
+        return self.counts[dimension][value]
+
+    def totals(self, dimension):
+        """value -> number of jobs for one dimension."""
+        return dict(self.counts[dimension])
+
+    # ---------------- Status transitions ----------------
+    def transition(self, key, status):
+        """Move a job to the next status, stamp the time and save it."""
+        job = self.jobs.get(key)
+        if job is None:
+            raise KeyError(key)
+        if TRANSITIONS.get(job.status) != status:
+            raise InvalidTransition(f"{job.job_id or key}: cannot go from {job.status} to {status}")
+
+        now = datetime.now().isoformat(timespec="seconds")
+        stamp = {"started_at": now} if status == IN_PROGRESS else {"completed_at": now}
+        job = replace(job, status=status, **stamp)
+        self.save(key, self.resolver.record(job))
+        return self.jobs.get(key, job)
+
+    def start(self, key):
+        return self.transition(key, IN_PROGRESS)
+
+    def complete(self, key):
+        return self.transition(key, COMPLETED)
+
+
+_manager = None
+
+
+def get_job_manager(load=True):
+    """Shared JobManager over the shared storage, loaded on first use."""
+    global _manager
+    if _manager is None:
+        _manager = JobManager(get_storage())
+    if load:
+        _manager.ensure_loaded()
+    return _manager
+
+
+def get_mold_usage():
+    """The shared manager's mold usage ledger (loads the job history once)."""
+    return get_job_manager().usage
@@ -0,0 +1,78 @@
+# backend/services/job_records.py
+from backend.models.job import Job, SNAPSHOT_FIELDS
+from backend.services.file_handler import get_storage
+from backend.services.mold_catalog import MoldCatalog, get_mold_catalog
+
+
+class JobResolver:
+    """Reads job records as Job models and joins them to the mold catalog.
+
+    Jobs store a mold id plus the few SNAPSHOT_FIELDS; everything else about
+    the mold is looked up in the cached catalog when it is shown, so an
+    edited mold shows up in its jobs. Jobs whose mold is gone fall back to
+    the full copy older job files embed, then to the snapshot fields.
+    """
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog or get_mold_catalog(load=False)
+        self.orphans = {}      # mold id -> Mold from embedded copies
+        self.operators = {}    # shared operator snapshots
+
+    def load(self, record):
+        """Job model for a stored job record."""
+        return Job.from_dict(record, self.orphans, self.operators)
+
+    def record(self, job):
+        """Job record to store, keeping the mold copy only for orphaned jobs."""
+        if self.catalog.find(job.mold_id) is None:
+            return job.to_dict(self.orphans.get(job.mold_id))
+        return job.to_dict()
+
+    def mold_field(self, job, name):
+        """Current value of a mold field for a job."""
+        data = self.catalog.find(job.mold_id)
+        if data is not None:
+            return data.get(name)
+        mold = self.orphans.get(job.mold_id)
+        if mold is not None:
+            return getattr(mold, name, None)
+        return getattr(job, name) if name in SNAPSHOT_FIELDS else None
+
+
+def migrate_jobs(storage=None, catalog=None, dry_run=False):
+    """Rewrite job records that embed a mold copy into the normalized form.
+
+    The copy is kept only when its mold is no longer in the catalog, since
+    it is then the only record of the mold. Returns (normalized, kept) counts.
+    """
+    storage = storage or get_storage()
+    if catalog is None:
+        catalog = MoldCatalog(storage)
+        catalog.load()
+
+    molds = {}
+    rewritten = {}
+    normalized = kept = 0
+    for key, record in storage.load_all("jobs").items():
+        if "mold" not in record:
+            continue
+        job = Job.from_dict(record, molds)
+        if catalog.find(job.mold_id) is None:
+            rewritten[key] = job.to_dict(molds.get(job.mold_id))
+            kept += 1
+        else:
+            rewritten[key] = job.to_dict()
+            normalized += 1
+    if rewritten and not dry_run:
+        storage.save_many("jobs", rewritten)
+    return normalized, kept
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Normalize stored job records to mold ids.")
+    parser.add_argument("--dry-run", action="store_true", help="count only, write nothing")
+    args = parser.parse_args()
+    normalized, kept = migrate_jobs(dry_run=args.dry_run)
+    print(f"{normalized} jobs normalized, {kept} kept their mold copy (mold no longer in the catalog).")
@@ -0,0 +1,136 @@
+# backend/services/job_writer.py
+import atexit
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from backend.services.file_handler import RecordExists
+from backend.services.instrumentation import count, timed
+
+# How long the writer waits for more records before writing a batch
+BATCH_WINDOW_S = 0.05
+
+
+class JobWriter(QObject):
+    """Background writer queue for job records.
+
+    save() only files the record under its key and returns; a second save
+    of the same key before it is written replaces the first, so a burst
+    of updates to one job costs one write. A daemon thread takes
+    everything queued after a short batch window and writes it with
+    storage.save_many(..., durable=True): atomic temp file + rename, one
+    fsync per file and one per folder for the whole batch.
+
+    Records saved with create=True are new: they are only written if their
+    key is still free, and rejected(keys) reports the ones that were not
+    (another record already holds the key) instead of overwriting it.
+
+    saved(keys) and failed(keys, message) report each batch back; Qt
+    delivers them on the GUI thread. Failed records go back in the queue
+    unless a newer version arrived meanwhile, and are retried with the
+    next save() or flush().
+    """
+
+    saved = pyqtSignal(list)
+    failed = pyqtSignal(list, str)
+    rejected = pyqtSignal(list)
+
+    def __init__(self, storage, kind="jobs", parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.kind = kind
+        self._pending = {}         # key -> newest unwritten record
+        self._creates = set()      # pending keys that must not exist yet
+        self._writing = False
+        self._failed = False       # last write failed; wait for save()/flush()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def save(self, key, record, create=False):
+        with self._cond:
+            if key in self._pending:
+                count("job_writer.coalesced")
+            self._pending[key] = record
+            if create:
+                self._creates.add(key)
+            self._failed = False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="job-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush, 10)  # do not lose queued jobs on exit
+            self._cond.notify_all()
+
+    def pending(self, key):
+        """The queued record for key, or None once it is written."""
+        with self._cond:
+            return self._pending.get(key)
+
+    @property
+    def busy(self):
+        """True while records are queued or being written."""
+        with self._cond:
+            return bool(self._pending) or self._writing
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far is written. Returns False if
+        that timed out or the write failed (the records stay queued)."""
+        with self._cond:
+            self._failed = False
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: (not self._pending or self._failed) and not self._writing, timeout)
+            return not self._pending and not self._writing
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # after a failure, wait for the next save()/flush() to retry
+                self._cond.wait_for(lambda: self._pending and not self._failed)
+            time.sleep(BATCH_WINDOW_S)  # let a burst of saves land in the same batch
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                creates, self._creates = self._creates, set()
+                self._writing = True
+            rejected = []
+            try:
+                rejected = self._write(batch, creates)
+                error = None
+            except Exception as e:
+                print(f"Failed to save {self.kind} {', '.join(batch)}: {e}")
+                error = str(e)
+            with self._cond:
+                self._writing = False
+                if error is not None:
+                    for key, record in batch.items():
+                        self._pending.setdefault(key, record)
+                    self._creates |= creates
+                    self._failed = True
+                self._cond.notify_all()
+            if error is None:
+                self._emit(self.saved, [key for key in batch if key not in rejected])
+                if rejected:
+                    self._emit(self.rejected, rejected)
+            else:
+                self._emit(self.failed, list(batch), error)
+
+    @timed("job_writer.write")
+    def _write(self, batch, creates):
+        """Write a batch; returns the new keys that were already taken."""
+        updates = {key: record for key, record in batch.items() if key not in creates}
+        if updates:
+            self.storage.save_many(self.kind, updates, durable=True)
+        new = {key: record for key, record in batch.items() if key in creates}
+        if new:
+            try:
+                self.storage.save_many(self.kind, new, durable=True, create=True)
+            except RecordExists as e:
+                print(f"Not saving {self.kind} {', '.join(e.keys)}: {e}")
+                return e.keys
+        return []
+
+    @staticmethod
+    def _emit(signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass  # the writer was deleted during shutdown
@@ -0,0 +1,339 @@
+# backend/services/mold_catalog.py
+import threading
+import weakref
+from collections import Counter
+
+from backend.services.file_handler import ChangeSet, RecordExists, get_storage
+from backend.services.id_allocator import allocator_for, get_mold_ids
+from backend.services.instrumentation import timed
+
+# Fields the mold screens filter on; each gets an inverted index value -> keys
+INDEXED_FIELDS = ("vehicle", "system", "mold_type", "chemical_type", "mixing_ratio", "created_at")
+
+# Part numbers are indexed by every substring up to this length
+NGRAM_SIZE = 3
+
+
+def _ngrams(text):
+    """All substrings of text with length 1..NGRAM_SIZE."""
+    grams = set()
+    for size in range(1, NGRAM_SIZE + 1):
+        for i in range(len(text) - size + 1):
+            grams.add(text[i:i + size])
+    return grams
+
+
+class MoldCatalog:
+    """In-memory catalog of the molds in a storage backend.
+
+    Molds are read once and kept in a dict keyed by their storage key
+    (the file name without .json). Every filter field has an inverted index
+    and part numbers have an n-gram index, so filtering and searching are
+    set intersections with no disk I/O.
+
+    refresh() asks the storage snapshot which molds changed and reloads
+    only those, then hands the resulting ChangeSet of keys to every
+    listener so screens can patch themselves instead of rebuilding.
+
+    Molds get a stable id (mold_id) from self.mold_ids when they are
+    created, which is also their key; self.ids maps ids to keys for older
+    files named otherwise. A new mold never replaces a stored one.
+    add(), update() and delete() write one file and patch the indexes in
+    place, without rescanning the folder.
+
+    Updates run on the GUI thread while searches may run on worker
+    threads; both hold self.lock.
+    """
+
+    def __init__(self, storage, mold_ids=None):
+        self.storage = storage
+        self.mold_ids = mold_ids or allocator_for(storage, "molds")
+        self.molds = {}                                        # key -> mold dict
+        self.indexes = {field: {} for field in INDEXED_FIELDS}  # field -> value -> set(keys)
+        self.part_index = {}                                   # n-gram -> set(keys)
+        self._part_numbers = {}                                # key -> lower-cased part number
+        self.ids = {}                                          # mold id -> key
+        self.snapshot = storage.snapshot("molds")
+        self._listeners = []
+        self.lock = threading.RLock()
+        self.loaded = False
+
+    # ---------------- Loading ----------------
+    def load(self):
+        """(Re)build the catalog from every stored mold."""
+        with self.lock:
+            self.molds = {}
+            self.indexes = {field: {} for field in INDEXED_FIELDS}
+            self.part_index = {}
+            self._part_numbers = {}
+            self.ids = {}
+            self.snapshot = self.storage.snapshot("molds")
+            self.loaded = True
+        return self.refresh()
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.load()
+
+    def refresh(self):
+        """Pick up molds added, changed or removed since the last scan.
+
+        Returns the ChangeSet of keys that was applied (and sent to listeners).
+        """
+        return self._apply(self.snapshot.scan())
+
+    def apply_changes(self, changes):
+        """Apply a ChangeSet of mold keys reported by the data watcher.
+
+        Ignored until the catalog is first loaded, which reads everything anyway.
+        """
+        if not self.loaded:
+            return ChangeSet([], [], [])
+        return self._apply(self.snapshot.restat(changes))
+
+    @timed("mold_catalog.apply")
+    def _apply(self, changes):
+        added, modified, removed = [], [], []
+        records = self.storage.load_many("molds", changes.added + changes.modified)
+        with self.lock:
+            for key in changes.removed:
+                if key in self.molds:
+                    self.remove(key)
+                    removed.append(key)
+            for key in changes.added + changes.modified:
+                existed = key in self.molds
+                data = records.get(key)
+                if data is not None:
+                    self.put(key, data)
+                    (modified if existed else added).append(key)
+                elif existed:
+                    self.remove(key)
+                    removed.append(key)
+        applied = ChangeSet(added, modified, removed)
+        if applied:
+            self._notify(applied)
+        return applied
+
+    # ---------------- Writes ----------------
+    def add(self, data):
+        """Store a new mold under a freshly allocated id; returns the id."""
+        while True:
+            mold_id = self.mold_ids.next_id()
+            try:
+                self._write(mold_id, {"mold_id": mold_id, **data}, create=True)
+                return mold_id
+            except RecordExists:
+                # the counter was lost or reset; ids only go up, so this ends
+                print(f"Mold id {mold_id} is already in use, taking the next one.")
+
+    def update(self, mold_id, data):
+        """Replace a mold's record, keeping its id and file."""
+        key = self.ids.get(mold_id)
+        if key is None:
+            raise KeyError(mold_id)
+        self._write(key, {**data, "mold_id": mold_id})
+
+    def delete(self, mold_id):
+        """Delete a mold's file and drop it from the indexes."""
+        key = self.ids.get(mold_id)
+        if key is None:
+            raise KeyError(mold_id)
+        self.storage.delete("molds", key)
+        with self.lock:
+            self.remove(key)
+        self._written(ChangeSet([], [], [key]))
+
+    def _write(self, key, data, create=False):
+        self.storage.save("molds", key, data, create=create)
+        with self.lock:
+            existed = key in self.molds
+            self.put(key, data)
+        self._written(ChangeSet([], [key], []) if existed else ChangeSet([key], [], []))
+
+    def _written(self, changes):
+        """Tell listeners about our own write, and record it in the snapshot
+        so the next scan does not report it again (anything else the
+        snapshot turns up on the way is applied as usual)."""
+        key = (changes.added + changes.modified + changes.removed)[0]
+        seen = self.snapshot.restat(ChangeSet([], [key], []))
+        others = ChangeSet(*([k for k in keys if k != key] for keys in seen))
+        self._notify(changes)
+        if others:
+            self._apply(others)
+
+    # ---------------- Listeners ----------------
+    def subscribe(self, listener):
+        """Call listener(changes) after every refresh that changed something.
+
+        Bound methods are held weakly so a closed screen does not stay alive.
+        """
+        ref = weakref.WeakMethod(listener) if hasattr(listener, "__self__") else (lambda: listener)
+        self._listeners.append(ref)
+
+    def unsubscribe(self, listener):
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, listener)]
+
+    def _notify(self, changes):
+        alive = []
+        for ref in self._listeners:
+            listener = ref()
+            if listener is not None:
+                alive.append(ref)
+                listener(changes)
+        self._listeners = alive
+
+    # ---------------- Index maintenance ----------------
+    def put(self, key, data):
+        """Insert or replace one mold and patch the indexes."""
+        if key in self.molds:
+            self.remove(key)
+        self.molds[key] = data
+        self.ids[data.get("mold_id") or key] = key
+        for field in INDEXED_FIELDS:
+            value = data.get(field, "")
+            self.indexes[field].setdefault(value, set()).add(key)
+        part_number = str(data.get("part_number", "")).lower()
+        self._part_numbers[key] = part_number
+        for gram in _ngrams(part_number):
+            self.part_index.setdefault(gram, set()).add(key)
+
+    def remove(self, key):
+        """Drop one mold from the catalog and its indexes."""
+        data = self.molds.pop(key, None)
+        if data is None:
+            return
+        mold_id = data.get("mold_id") or key
+        if self.ids.get(mold_id) == key:
+            del self.ids[mold_id]
+        for field in INDEXED_FIELDS:
+            value = data.get(field, "")
+            keys = self.indexes[field].get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.indexes[field][value]
+        part_number = self._part_numbers.pop(key, "")
+        for gram in _ngrams(part_number):
+            keys = self.part_index.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.part_index[gram]
+
+    # ---------------- Queries ----------------
+    def get(self, key):
+        return self.molds.get(key)
+
+    def find(self, mold_id):
+        """Mold record for a mold id (as jobs store it), wherever it is filed."""
+        key = self.ids.get(mold_id)
+        return self.molds.get(key) if key is not None else None
+
+    def values(self, field):
+        """Sorted distinct non-empty values of an indexed field."""
+        with self.lock:
+            return sorted(v for v in self.indexes[field] if v)
+
+    def facets(self, filters=None, text="", where=None):
+        """field -> {value: matching molds} for every indexed field.
+
+        filters and text mean the same as in search(); where(key) can narrow
+        the matches further. A field's own filter is left out of its counts,
+        so each value says how many molds selecting it instead would give.
+        Fields without a filter are counted in one shared pass over the
+        matches, each filtered field in one more; without any restriction
+        the counts are just the index sizes.
+        """
+        with self.lock:
+            active = {field: value for field, value in (filters or {}).items() if value}
+            postings = {field: self.indexes[field].get(value, set()) for field, value in active.items()}
+            text = text.strip()
+            if text:
+                postings["part_number"] = self._match_part_number(text)
+
+            def matching(exclude=None):
+                sets = sorted((keys for field, keys in postings.items() if field != exclude), key=len)
+                if not sets:
+                    keys = None if where is None else self.molds.keys()
+                else:
+                    keys = set(sets[0]).intersection(*sets[1:])
+                return keys if where is None else [key for key in keys if where(key)]
+
+            counts = self._count(matching(), [f for f in INDEXED_FIELDS if f not in active])
+            for field in active:
+                counts.update(self._count(matching(exclude=field), [field]))
+            return counts
+
+    def _count(self, keys, fields):
+        if keys is None:
+            return {field: {value: len(matched) for value, matched in self.indexes[field].items() if value}
+                    for field in fields}
+        counters = {field: Counter() for field in fields}
+        for key in keys:
+            data = self.molds[key]
+            for field in fields:
+                counters[field][data.get(field, "")] += 1
+        return {field: {value: n for value, n in counter.items() if value}
+                for field, counter in counters.items()}
+
+    def _match_part_number(self, text):
+        text = text.lower()
+        if len(text) <= NGRAM_SIZE:
+            return self.part_index.get(text, set())
+        postings = [self.part_index.get(text[i:i + NGRAM_SIZE], set())
+                    for i in range(len(text) - NGRAM_SIZE + 1)]
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        # n-grams only narrow the candidates; confirm the full substring
+        return {k for k in candidates if text in self._part_numbers[k]}
+
+    def matches(self, key, filters=None, text=""):
+        """Whether one mold satisfies the same criteria as search()."""
+        data = self.molds.get(key)
+        if data is None:
+            return False
+        for field, value in (filters or {}).items():
+            if value and data.get(field, "") != value:
+                return False
+        text = text.strip().lower()
+        return not text or text in self._part_numbers[key]
+
+    def sort_key(self, key):
+        """Order used by search(): mold name, then key."""
+        return (self.molds[key].get("mold_name") or "", key)
+
+    def search(self, filters=None, text=""):
+        """Keys of molds matching every field filter and the part-number text.
+
+        filters maps an indexed field to the required value; empty values
+        mean "any". Results are ordered by mold name.
+        """
+        with self.lock:
+            postings = []
+            for field, value in (filters or {}).items():
+                if value:
+                    postings.append(self.indexes[field].get(value, set()))
+            text = text.strip()
+            if text:
+                postings.append(self._match_part_number(text))
+
+            if postings:
+                postings.sort(key=len)
+                keys = set(postings[0]).intersection(*postings[1:])
+            else:
+                keys = self.molds.keys()
+            return sorted(keys, key=self.sort_key)
+
+
+_catalog = None
+
+
+def get_mold_catalog(load=True):
+    """Shared catalog over the shared storage, loaded on first use
+    (load=False hands it out without reading any molds yet)."""
+    global _catalog
+    if _catalog is None:
+        _catalog = MoldCatalog(get_storage(), get_mold_ids())
+    if load:
+        _catalog.ensure_loaded()
+    return _catalog
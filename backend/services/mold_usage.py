@@ -0,0 +1,76 @@
+# backend/services/mold_usage.py
+import weakref
+from collections import Counter
+
+NEAR_END_PERCENT = 90   # percent of life used at which a mold is flagged
+
+
+class MoldUsageLedger:
+    """Parts produced per mold by completed jobs, measured against its life span.
+
+    JobManager calls add() as completed jobs come and go and notify() once
+    per refresh, so every query here is a dict lookup instead of a scan of
+    the job history. Molds without a positive life_span are not tracked
+    (their remaining life and percent used are None).
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.used = Counter()   # mold id -> parts produced
+        self._changed = set()
+        self._listeners = []
+
+    # ---------------- Updates (from JobManager) ----------------
+    def add(self, mold_id, parts):
+        """Count parts (negative to take them back) against a mold."""
+        if not parts:
+            return
+        self.used[mold_id] += parts
+        if not self.used[mold_id]:
+            del self.used[mold_id]
+        self._changed.add(mold_id)
+
+    def subscribe(self, listener):
+        """Call listener(mold_ids) after a refresh changed their usage."""
+        ref = weakref.WeakMethod(listener) if hasattr(listener, "__self__") else (lambda: listener)
+        self._listeners.append(ref)
+
+    def notify(self):
+        changed, self._changed = self._changed, set()
+        if not changed:
+            return
+        alive = []
+        for ref in self._listeners:
+            listener = ref()
+            if listener is not None:
+                alive.append(ref)
+                listener(changed)
+        self._listeners = alive
+
+    # ---------------- Queries ----------------
+    def used_parts(self, mold_id):
+        return self.used[mold_id]
+
+    def life_span(self, mold_id):
+        data = self.catalog.find(mold_id)
+        try:
+            life = int(data.get("life_span") or 0) if data else 0
+        except (TypeError, ValueError):
+            return None
+        return life if life > 0 else None
+
+    def remaining(self, mold_id):
+        """Parts the mold can still produce (0 once worn out), or None if untracked."""
+        life = self.life_span(mold_id)
+        return None if life is None else max(life - self.used[mold_id], 0)
+
+    def percent_used(self, mold_id):
+        life = self.life_span(mold_id)
+        return None if life is None else 100.0 * self.used[mold_id] / life
+
+    def near_end_of_life(self, mold_id, percent=NEAR_END_PERCENT):
+        used = self.percent_used(mold_id)
+        return used is not None and used >= percent
+
+    def worn_out(self, mold_id):
+        return self.remaining(mold_id) == 0
@@ -0,0 +1,215 @@
+# backend/services/schedule_index.py
+import random
+from datetime import datetime
+
+
+def parse_time(value):
+    """datetime for an ISO string (as Qt's ISODate writes it), None if unusable."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _Node:
+    __slots__ = ("start", "end", "key", "priority", "left", "right", "max_end")
+
+    def __init__(self, start, end, key):
+        self.start = start
+        self.end = end
+        self.key = key
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.max_end = end
+
+
+class IntervalTree:
+    """Half-open [start, end) intervals with a key, in a treap ordered by
+    (start, key) whose nodes also track the largest end below them.
+
+    Insert and remove are O(log n) expected; a stabbing or overlap query is
+    O(log n + k) because subtrees that end too early are skipped whole.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    # ---------------- Updates ----------------
+    @staticmethod
+    def _update(node):
+        node.max_end = node.end
+        if node.left is not None and node.left.max_end > node.max_end:
+            node.max_end = node.left.max_end
+        if node.right is not None and node.right.max_end > node.max_end:
+            node.max_end = node.right.max_end
+
+    def _rotate_right(self, node):
+        left = node.left
+        node.left, left.right = left.right, node
+        self._update(node)
+        self._update(left)
+        return left
+
+    def _rotate_left(self, node):
+        right = node.right
+        node.right, right.left = right.left, node
+        self._update(node)
+        self._update(right)
+        return right
+
+    def insert(self, start, end, key):
+        self.root = self._insert(self.root, _Node(start, end, key))
+        self.size += 1
+
+    def _insert(self, node, new):
+        if node is None:
+            return new
+        if (new.start, new.key) < (node.start, node.key):
+            node.left = self._insert(node.left, new)
+            if node.left.priority > node.priority:
+                return self._rotate_right(node)
+        else:
+            node.right = self._insert(node.right, new)
+            if node.right.priority > node.priority:
+                return self._rotate_left(node)
+        self._update(node)
+        return node
+
+    def remove(self, start, key):
+        """Remove the interval inserted with this start and key; False if absent."""
+        size = self.size
+        self.root = self._remove(self.root, start, key)
+        return self.size < size
+
+    def _remove(self, node, start, key):
+        if node is None:
+            return None
+        if (start, key) < (node.start, node.key):
+            node.left = self._remove(node.left, start, key)
+        elif (start, key) > (node.start, node.key):
+            node.right = self._remove(node.right, start, key)
+        else:
+            if node.left is None:
+                self.size -= 1
+                return node.right
+            if node.right is None:
+                self.size -= 1
+                return node.left
+            # rotate the node down towards a leaf, then keep removing below
+            if node.left.priority > node.right.priority:
+                node = self._rotate_right(node)
+                node.right = self._remove(node.right, start, key)
+            else:
+                node = self._rotate_left(node)
+                node.left = self._remove(node.left, start, key)
+        self._update(node)
+        return node
+
+    # ---------------- Queries ----------------
+    def overlapping(self, lo, hi):
+        """(start, end, key) of every interval overlapping [lo, hi)."""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None or node.max_end <= lo:
+                continue
+            stack.append(node.left)
+            if node.start < hi:
+                if node.end > lo:
+                    found.append((node.start, node.end, node.key))
+                stack.append(node.right)
+        return found
+
+    def at(self, t):
+        """(start, end, key) of every interval containing instant t."""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None or node.max_end <= t:
+                continue
+            stack.append(node.left)
+            if node.start <= t:
+                if node.end > t:
+                    found.append((node.start, node.end, node.key))
+                stack.append(node.right)
+        return found
+
+
+class ScheduleIndex:
+    """Job windows of open (not completed) jobs: all of them, and per mold
+    and per operator for double-booking checks.
+
+    JobManager adds and removes jobs here as they are created, changed or
+    completed.
+    """
+
+    def __init__(self):
+        self.all = IntervalTree()
+        self.by_mold = {}        # mold id -> IntervalTree
+        self.by_operator = {}    # username -> IntervalTree
+        self._entries = {}       # job key -> (start, end, mold id, username)
+
+    def add(self, key, job):
+        """Index a job's window; jobs without a valid window are skipped."""
+        self.remove(key)
+        start, end = parse_time(job.start_datetime), parse_time(job.end_datetime)
+        if start is None or end is None or end <= start:
+            return
+        operator = job.operator.username if job.operator else None
+        self._entries[key] = (start, end, job.mold_id, operator)
+        self.all.insert(start, end, key)
+        if job.mold_id is not None:
+            self.by_mold.setdefault(job.mold_id, IntervalTree()).insert(start, end, key)
+        if operator is not None:
+            self.by_operator.setdefault(operator, IntervalTree()).insert(start, end, key)
+
+    def remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        start, _, mold_id, operator = entry
+        self.all.remove(start, key)
+        for trees, name in ((self.by_mold, mold_id), (self.by_operator, operator)):
+            tree = trees.get(name)
+            if tree is not None:
+                tree.remove(start, key)
+                if not tree:
+                    del trees[name]
+
+    def entries(self):
+        """(key, start, end, mold id, username) of every indexed job."""
+        return [(key, *entry) for key, entry in self._entries.items()]
+
+    def running_at(self, t=None):
+        """Keys of the jobs whose window contains t (default: now)."""
+        return [key for _, _, key in self.all.at(t or datetime.now())]
+
+    def between(self, lo, hi):
+        """Keys of the jobs whose window overlaps [lo, hi)."""
+        return [key for _, _, key in self.all.overlapping(parse_time(lo), parse_time(hi))]
+
+    def conflicts(self, start, end, mold_id=None, operator=None, exclude=None):
+        """Open jobs double-booking a mold or operator in [start, end).
+
+        Returns {"mold": [keys], "operator": [keys]}; exclude skips one job
+        key (the job being edited).
+        """
+        start, end = parse_time(start), parse_time(end)
+        found = {"mold": [], "operator": []}
+        if start is None or end is None:
+            return found
+        for kind, trees, name in (("mold", self.by_mold, mold_id),
+                                  ("operator", self.by_operator, operator)):
+            tree = trees.get(name)
+            if tree is not None:
+                found[kind] = [key for _, _, key in tree.overlapping(start, end) if key != exclude]
+        return found
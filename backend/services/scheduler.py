@@ -0,0 +1,169 @@
+# backend/services/scheduler.py
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from backend.models.job import COMPLETED, NOT_STARTED, SNAPSHOT_FIELDS
+
+MINUTES_PER_PART = 10
+SCHEDULED_ROLES = ("Operator",)
+
+
+@dataclass(frozen=True, slots=True)
+class PartOrder:
+    part_number: str
+    quantity: int
+    due: datetime
+    mold_type: str = None     # None accepts any mold type
+
+
+@dataclass(frozen=True, slots=True)
+class Assignment:
+    """One job the scheduler proposes: part of an order on one mold and operator."""
+
+    order: PartOrder
+    mold_id: str
+    operator: str             # username
+    quantity: int
+    start: datetime
+    end: datetime
+
+    @property
+    def late(self):
+        return self.end > self.order.due
+
+
+@dataclass(slots=True)
+class ScheduleResult:
+    assignments: list
+    unscheduled: list         # (PartOrder, quantity left, reason)
+
+    def summary(self):
+        orders_late = {a.order for a in self.assignments if a.late}
+        return {
+            "jobs": len(self.assignments),
+            "parts": sum(a.quantity for a in self.assignments),
+            "late_orders": len(orders_late),
+            "unscheduled_orders": len(self.unscheduled),
+            "makespan_end": max((a.end for a in self.assignments), default=None),
+        }
+
+
+class ProductionScheduler:
+    """Greedy scheduler packing part orders onto molds, operators and time.
+
+    Orders are taken earliest due first. Each one goes to the molds with its
+    part number (and mold type, if the order names one) that still have
+    life left, split across molds when one cannot make the whole quantity.
+    For every chunk the mold that can finish it soonest wins, paired with
+    the operator (of a scheduled role) who is free earliest, kept in a
+    heap. Resources are booked back to back from the end of their last
+    booking; gaps between existing bookings are not filled.
+
+    Plans are proposals: nothing is saved. job_record() turns an
+    assignment into the record SelectMoldScreen would write.
+    """
+
+    def __init__(self, molds, operators, remaining_life=None, busy=(),
+                 minutes_per_part=MINUTES_PER_PART, roles=SCHEDULED_ROLES):
+        """molds: mold id -> mold record; operators: operator records;
+        remaining_life(mold id): parts left, or None for untracked molds;
+        busy: (mold id, username, end) of bookings that already exist."""
+        self.molds = molds
+        self.operators = {op["username"]: op for op in operators if op.get("role") in roles}
+        self.remaining_life = remaining_life or (lambda mold_id: None)
+        self.minutes_per_part = minutes_per_part
+        self.busy = list(busy)
+
+        self.by_part = {}   # part number -> [mold id]
+        for mold_id, mold in molds.items():
+            self.by_part.setdefault(mold.get("part_number"), []).append(mold_id)
+
+    @classmethod
+    def from_manager(cls, manager, operators, **kwargs):
+        """Scheduler over the shared job manager's catalog, life ledger and open jobs."""
+        catalog = manager.resolver.catalog
+        with catalog.lock:
+            molds = dict(catalog.molds)
+        booked = {}   # parts that open jobs will still take from each mold
+        for job in manager.jobs.values():
+            if job.status != COMPLETED:
+                booked[job.mold_id] = booked.get(job.mold_id, 0) + job.parts
+
+        def remaining_life(mold_id):
+            left = manager.usage.remaining(mold_id)
+            return None if left is None else max(left - booked.get(mold_id, 0), 0)
+
+        busy = [(mold_id, username, end) for _, _, end, mold_id, username in manager.schedule.entries()]
+        return cls(molds, operators, remaining_life, busy, **kwargs)
+
+    def plan(self, orders, now=None):
+        now = now or datetime.now().replace(microsecond=0)
+        per_part = timedelta(minutes=self.minutes_per_part)
+
+        mold_free = {}
+        life = {}
+        op_free = {username: now for username in self.operators}
+        for mold_id, username, end in self.busy:
+            if mold_id in self.molds and end > mold_free.get(mold_id, now):
+                mold_free[mold_id] = end
+            if username in op_free and end > op_free[username]:
+                op_free[username] = end
+        op_heap = [(free, username) for username, free in op_free.items()]
+        heapq.heapify(op_heap)
+
+        assignments, unscheduled = [], []
+        for order in sorted(orders, key=lambda o: (o.due, o.part_number)):
+            left = order.quantity
+            if not op_heap:
+                unscheduled.append((order, left, "no operator with a scheduled role"))
+                continue
+            candidates = [m for m in self.by_part.get(order.part_number, ())
+                          if order.mold_type is None or self.molds[m].get("mold_type") == order.mold_type]
+            if not candidates:
+                unscheduled.append((order, left, "no mold for this part number and type"))
+                continue
+
+            while left > 0:
+                op_start, username = op_heap[0]
+                best = None
+                for mold_id in candidates:
+                    if mold_id not in life:
+                        life[mold_id] = self.remaining_life(mold_id)
+                    cap = life[mold_id]
+                    chunk = left if cap is None else min(left, cap)
+                    if chunk <= 0:
+                        continue
+                    start = max(mold_free.get(mold_id, now), op_start)
+                    end = start + chunk * per_part
+                    if best is None or end < best[0]:
+                        best = (end, start, mold_id, chunk)
+                if best is None:
+                    unscheduled.append((order, left, "mold life exhausted"))
+                    break
+
+                end, start, mold_id, chunk = best
+                assignments.append(Assignment(order, mold_id, username, chunk, start, end))
+                heapq.heapreplace(op_heap, (end, username))
+                mold_free[mold_id] = end
+                if life[mold_id] is not None:
+                    life[mold_id] -= chunk
+                left -= chunk
+        return ScheduleResult(assignments, unscheduled)
+
+    def job_record(self, assignment, job_id):
+        """Job record (as SelectMoldScreen saves it) for an assignment."""
+        mold = self.molds[assignment.mold_id]
+        op = self.operators[assignment.operator]
+        record = {
+            "job_id": job_id,
+            "operator": {key: op.get(key) for key in ("username", "name", "epf_number", "role")},
+            "mold_id": assignment.mold_id,
+        }
+        for field in SNAPSHOT_FIELDS:
+            record[field] = mold.get(field)
+        record["part_count"] = assignment.quantity
+        record["start_datetime"] = assignment.start.isoformat(timespec="seconds")
+        record["end_datetime"] = assignment.end.isoformat(timespec="seconds")
+        record["status"] = NOT_STARTED
+        return record
@@ -0,0 +1,54 @@
+# benchmarks/bench_dispense_validation.py
+"""Throughput of DispenseValidator on synthetic dispense logs.
+
+    python -m benchmarks.bench_dispense_validation [--readings 1000000 10000000] [--calibrations 50]
+
+Builds a calibration history with --calibrations snapshots spread over 30
+days and a shift log of random letters, values and timestamps inside that
+window, then times one validate() call per size (excluding input
+generation) and reports readings per second.
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from backend.models.mixing_ratio import MixingRatios, RATIO_LETTERS
+from backend.services.calibration_repository import calibration_time
+from backend.services.dispense_validation import DispenseValidator
+from benchmarks.synthetic import synthetic_calibrations
+
+
+def synthetic_history(count, start):
+    calibrations = synthetic_calibrations(count, start=start, span=timedelta(days=30))
+    return [(calibration_time(key), MixingRatios.from_dict(ranges)) for key, ranges in calibrations.items()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readings", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--calibrations", type=int, default=50)
+    args = parser.parse_args()
+
+    start = datetime(2025, 9, 1)
+    validator = DispenseValidator(synthetic_history(args.calibrations, start))
+    rng = np.random.default_rng(1)
+    letters_pool = np.array(RATIO_LETTERS)
+
+    print(f"{'readings':>10} {'time (s)':>9} {'readings/s':>12} {'pass rate':>10}")
+    for size in args.readings:
+        letters = letters_pool[rng.integers(0, len(RATIO_LETTERS), size)]
+        values = rng.uniform(0, 14, size)
+        offsets = rng.integers(0, 30 * 86400, size).astype("timedelta64[s]")
+        timestamps = np.datetime64(start, "s") + offsets
+
+        t0 = time.perf_counter()
+        result = validator.validate(letters, values, timestamps)
+        summary = result.summary()
+        elapsed = time.perf_counter() - t0
+        print(f"{size:>10} {elapsed:>9.3f} {size / elapsed:>12,.0f} {summary['pass_rate']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_job_flow_memory.py
+"""Widget count and RSS while creating many jobs in a row.
+
+    python -m benchmarks.bench_job_flow_memory [--jobs 1000] [--every 100]
+
+Drives HomeScreen's Create Job -> Select Mold -> Start Job flow under
+offscreen Qt against a copy of the sample data, and prints the number of
+live widgets and the resident set size every --every jobs. The widget count
+should stay flat once the pooled screens are built; RSS should only grow by
+the job records the job status table holds.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource  # not on Windows
+        # peak rather than current RSS; kB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--every", type=int, default=100)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="rimworks-bench-")
+    shutil.copytree("data/molds", os.path.join(root, "molds"))
+    shutil.copytree("data/operators", os.path.join(root, "operators"))
+    os.environ["RIMWORKS_DATA"] = root
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtCore import QDateTime
+    from PyQt6.QtWidgets import QApplication
+    from gui.home import HomeScreen
+    from backend.services.job_manager import get_job_manager
+
+    app = QApplication(sys.argv)
+    home = HomeScreen()
+    operator = {"username": "bench", "name": "Bench", "epf_number": None, "role": "Operator"}
+
+    print(f"{'jobs':>6} {'widgets':>8} {'rss (MB)':>9}")
+    try:
+        for i in range(1, args.jobs + 1):
+            home.goto_select_mold({"job_id": None, "operator": dict(operator)})
+            select_screen = home.screen("select_mold")
+            select_screen.open_view_mold_screen()
+            picker = select_screen.view_screen
+            picker.mold_list_widget.setCurrentRow(i % picker.mold_list_widget.count())
+            picker.select_current_mold()
+            # one hour per job, so no job double-books a mold or operator
+            start = QDateTime.currentDateTime().addSecs(3600 * i)
+            select_screen.start_dt.setDateTime(start)
+            select_screen.end_dt.setDateTime(start.addSecs(3600))
+            select_screen.start_job()
+            app.processEvents()
+            if i % args.every == 0:
+                print(f"{i:>6} {len(QApplication.allWidgets()):>8} {rss_mb():>9.1f}")
+    finally:
+        get_job_manager(load=False).writer.flush()  # jobs are saved in the background
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_job_records.py
+"""Job-history load time and disk footprint before and after normalization.
+
+    python -m benchmarks.bench_job_records [--jobs 50000] [--molds 200]
+
+Writes a synthetic JSON data tree whose job files embed a copy of their
+mold, as SelectMoldScreen used to save them, then measures the size of the
+jobs folder and the time to read every job and resolve its mold fields.
+The tree is then migrated with backend.services.job_records.migrate_jobs
+and measured again.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from backend.services.file_handler import JsonStorage
+from backend.services.job_records import JobResolver, migrate_jobs
+from backend.services.mold_catalog import MoldCatalog
+from benchmarks.synthetic import synthetic_jobs, synthetic_molds, synthetic_operators
+
+
+def folder_bytes(folder):
+    return sum(entry.stat().st_size for entry in os.scandir(folder) if entry.is_file())
+
+
+def load_history(root):
+    """Seconds to read every job record and resolve the columns the job table shows."""
+    start = time.perf_counter()
+    storage = JsonStorage(root)
+    catalog = MoldCatalog(storage)
+    catalog.load()
+    resolver = JobResolver(catalog)
+    for record in storage.load_all("jobs").values():
+        job = resolver.load(record)
+        for field in ("mold_name", "vehicle", "system"):
+            resolver.mold_field(job, field)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--molds", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="rimworks-bench-") as root:
+        storage = JsonStorage(root)
+        molds = synthetic_molds(args.molds)
+        storage.save_many("molds", molds)
+        jobs = synthetic_jobs(args.jobs, molds, synthetic_operators(50), embed_mold=True)
+        storage.save_many("jobs", {job["job_id"]: job for job in jobs})
+        jobs_folder = storage.folders["jobs"]
+
+        print(f"{args.jobs} jobs, {args.molds} molds")
+        print(f"{'layout':>12} {'disk (MB)':>10} {'load (s)':>9}")
+        before = (folder_bytes(jobs_folder), load_history(root))
+        print(f"{'embedded':>12} {before[0] / 2**20:>10.1f} {before[1]:>9.2f}")
+
+        start = time.perf_counter()
+        normalized, kept = migrate_jobs(storage)
+        migrate_s = time.perf_counter() - start
+
+        after = (folder_bytes(jobs_folder), load_history(root))
+        print(f"{'normalized':>12} {after[0] / 2**20:>10.1f} {after[1]:>9.2f}")
+        print(f"migration: {normalized} normalized, {kept} kept in {migrate_s:.2f} s; "
+              f"disk {before[0] / after[0]:.1f}x smaller, load {before[1] / after[1]:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/bench_login.py
+"""Operator login latency against operator registries of growing size.
+
+    python -m benchmarks.bench_login [--sizes 10 100 1000 10000 100000]
+
+For each size a fresh JSON data folder is filled with operators sharing one
+precomputed password hash (hashing 100k passwords would only time PBKDF2).
+Reported per size: first login of an operator (full PBKDF2 check) and the
+median of repeated logins (verification cache).
+"""
+import argparse
+import statistics
+import tempfile
+import time
+
+from backend.services.auth import AuthService, hash_password
+from backend.services.file_handler import JsonStorage
+
+PASSWORD = "12345678"
+
+
+def bench_size(size, repeats=200):
+    with tempfile.TemporaryDirectory() as root:
+        storage = JsonStorage(root)
+        password_hash = hash_password(PASSWORD)
+        storage.save_many("operators", {
+            f"op{i}": {"name": f"Operator {i}", "username": f"op{i}",
+                       "password_hash": password_hash, "role": "Operator"}
+            for i in range(size)
+        })
+        auth = AuthService(storage)
+        auth.sync()
+        username = f"op{size // 2}"
+
+        start = time.perf_counter()
+        assert auth.verify(username, PASSWORD)
+        first = time.perf_counter() - start
+
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            assert auth.verify(username, PASSWORD)
+            samples.append(time.perf_counter() - start)
+        return {"operators": size, "first_ms": first * 1000,
+                "cached_median_ms": statistics.median(samples) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'operators':>10} {'first login (ms)':>17} {'cached login (ms)':>18}")
+    for size in args.sizes:
+        result = bench_size(size)
+        print(f"{result['operators']:>10} {result['first_ms']:>17.2f} {result['cached_median_ms']:>18.4f}")
+
+
+if __name__ == "__main__":
+    main()
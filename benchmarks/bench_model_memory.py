@@ -0,0 +1,61 @@
+# benchmarks/bench_model_memory.py
+"""Memory held by a job history as raw dicts versus Job models.
+
+    python -m benchmarks.bench_model_memory [--jobs 100000] [--molds 200] [--operators 50]
+
+Builds synthetic job records shaped like the ones SelectMoldScreen saves
+(each with an embedded copy of its mold and operator), round-trips each one
+through json like a job file read from disk, and measures with tracemalloc
+what stays allocated when the history is held as parsed dicts and when it
+is held as Job models with shared Mold and Operator objects.
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from backend.models.job import Job
+from benchmarks.synthetic import synthetic_jobs, synthetic_molds, synthetic_operators
+
+
+def held_bytes(build):
+    """Bytes still allocated by what build() returns, once it is built."""
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--molds", type=int, default=200)
+    parser.add_argument("--operators", type=int, default=50)
+    args = parser.parse_args()
+
+    molds = synthetic_molds(args.molds)
+    operators = synthetic_operators(args.operators)
+    texts = [json.dumps(job) for job in synthetic_jobs(args.jobs, molds, operators, embed_mold=True)]
+
+    def as_dicts():
+        return [json.loads(text) for text in texts]
+
+    def as_models():
+        molds, operators = {}, {}
+        jobs = [Job.from_dict(json.loads(text), molds, operators) for text in texts]
+        return jobs, molds, operators
+
+    dict_bytes = held_bytes(as_dicts)
+    model_bytes = held_bytes(as_models)
+    print(f"{args.jobs} jobs, {args.molds} molds, {args.operators} operators")
+    print(f"{'dicts':>8} {dict_bytes / 2**20:>9.1f} MB  {dict_bytes / args.jobs:>7.0f} B/job")
+    print(f"{'models':>8} {model_bytes / 2**20:>9.1f} MB  {model_bytes / args.jobs:>7.0f} B/job")
+    print(f"{'ratio':>8} {dict_bytes / model_bytes:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
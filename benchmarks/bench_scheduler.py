@@ -0,0 +1,54 @@
+# benchmarks/bench_scheduler.py
+"""ProductionScheduler runtime and plan quality on synthetic workloads.
+
+    python -m benchmarks.bench_scheduler [--orders 1000 5000 20000] [--molds 500] [--operators 40]
+
+Molds come from the synthetic mold generator, with about three molds per
+part number. Orders ask for 1-60 parts of a random part number, due within
+two weeks. Reported per size: planning time, jobs created, late and
+unschedulable orders, and when the last job ends.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from backend.services.scheduler import PartOrder, ProductionScheduler
+from benchmarks.synthetic import synthetic_molds, synthetic_operators
+
+
+def synthetic_workload(orders, molds, seed=1):
+    rng = random.Random(seed)
+    catalog = synthetic_molds(molds, seed)
+    part_numbers = [f"P{i:05d}" for i in range(max(molds // 3, 1))]
+    for mold in catalog.values():
+        mold["part_number"] = rng.choice(part_numbers)
+    now = datetime(2025, 10, 1, 6, 0)
+    queue = [PartOrder(rng.choice(part_numbers), rng.randint(1, 60),
+                       now + timedelta(hours=rng.randint(8, 24 * 14)))
+             for _ in range(orders)]
+    return catalog, queue, now
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--molds", type=int, default=500)
+    parser.add_argument("--operators", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'orders':>7} {'plan (s)':>9} {'jobs':>7} {'late':>6} {'unsched':>8}  last job ends")
+    for size in args.orders:
+        molds, orders, now = synthetic_workload(size, args.molds)
+        scheduler = ProductionScheduler(molds, synthetic_operators(args.operators),
+                                        remaining_life=lambda m: molds[m]["life_span"] * 20)
+        start = time.perf_counter()
+        result = scheduler.plan(orders, now)
+        elapsed = time.perf_counter() - start
+        s = result.summary()
+        print(f"{size:>7} {elapsed:>9.3f} {s['jobs']:>7} {s['late_orders']:>6} "
+              f"{s['unscheduled_orders']:>8}  {s['makespan_end']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# benchmarks/bench_screens.py
+"""Timings of the screens' data paths on synthetic data, written as JSON.
+
+    python -m benchmarks.bench_screens [--sizes 1000 10000 100000]
+        [--storage json|sqlite] [--repeat 5] [--out bench_screens.json]
+
+A size is the number of jobs; each data set also gets size/10 molds,
+size/100 operators and size/1000 calibrations (with small minimums). For
+every size a fresh tree is generated with benchmarks.synthetic and measured
+in its own process under offscreen Qt, so the shared catalog, job manager
+and auth service start cold (the catalog and job history loads are timed
+on their own, before the screens that share them). Cold timings are taken once; warm ones are the
+median of --repeat runs. Results (in ms) go to --out together with the
+Python/Qt versions, platform and git commit, for comparing releases.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+
+def scale(size):
+    return {"molds": max(size // 10, 10), "jobs": size,
+            "operators": max(size // 100, 10), "calibrations": max(size // 1000, 5)}
+
+
+def measure(repeat):
+    """Time the hot paths against the storage selected by the environment."""
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    timings = {}
+
+    def once(name, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[name] = (time.perf_counter() - start) * 1000
+        return result
+
+    def warm(name, fn):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        timings[name] = statistics.median(samples)
+
+    from backend.services.job_manager import get_job_manager
+    from backend.services.mold_catalog import get_mold_catalog
+    from benchmarks.synthetic import SYNTHETIC_PASSWORD
+    from gui.widgets.create_job_screen import CreateJobScreen
+    from gui.widgets.job_status_screen import JobStatusScreen
+    from gui.widgets.operator_login_screen import OperatorLoginScreen
+    from gui.widgets.view_mold_screen import ViewMoldScreen
+
+    once("mold_catalog.load (cold)", get_mold_catalog)
+    once("job_manager.load (cold)", get_job_manager)   # job history, life ledger, schedule
+    view = once("ViewMoldScreen() (cold)", ViewMoldScreen)
+    warm("ViewMoldScreen.refresh_filters", view.refresh_filters)
+    warm("ViewMoldScreen.refresh_mold_list", view.refresh_mold_list)
+    view.search_input.blockSignals(True)
+    view.search_input.setText("12")
+    view.search_input.blockSignals(False)
+    warm("ViewMoldScreen.refresh_mold_list (search)", view.refresh_mold_list)
+    view.system_filter.blockSignals(True)
+    view.system_filter.setCurrentIndex(1)
+    view.system_filter.blockSignals(False)
+    filters, text = view.current_filters(), view.search_input.text()
+    warm("MoldCatalog.facets (filter + search)", lambda: view.catalog.facets(filters, text))
+
+    status = once("JobStatusScreen() (cold)", JobStatusScreen)
+    warm("JobStatusScreen.load_jobs", status.load_jobs)
+
+    create = once("CreateJobScreen() (cold)", CreateJobScreen)
+    warm("CreateJobScreen.load_operators", create.load_operators)
+    warm("CreateJobScreen.refresh_operator_list", create.refresh_operator_list)
+
+    login = OperatorLoginScreen()
+    login.username_input.setText("operator0@rimworks")
+    login.password_input.setText(SYNTHETIC_PASSWORD)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not once("OperatorLoginScreen.validate_login (first)", login.validate_login):
+            raise RuntimeError("synthetic operator login failed")
+        warm("OperatorLoginScreen.validate_login (cached)", login.validate_login)
+
+    app.processEvents()
+    return timings
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_size(size, storage_kind, repeat):
+    from backend.services.file_handler import JsonStorage, SqliteStorage
+    from benchmarks.synthetic import generate_tree
+
+    counts = scale(size)
+    with tempfile.TemporaryDirectory(prefix="rimworks-bench-") as root:
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen", RIMWORKS_DATA=root,
+                   RIMWORKS_STORAGE=storage_kind, RIMWORKS_DB=os.path.join(root, "rimworks.db"))
+        storage = SqliteStorage(env["RIMWORKS_DB"]) if storage_kind == "sqlite" else JsonStorage(root)
+        start = time.perf_counter()
+        generate_tree(storage, **counts)
+        generate_s = time.perf_counter() - start
+
+        result_path = os.path.join(root, "timings.json")
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_screens", "--measure", result_path,
+                        "--repeat", str(repeat)], env=env, check=True)
+        with open(result_path) as f:
+            timings = json.load(f)
+    return {"size": size, "records": counts, "generate_s": round(generate_s, 3), "timings_ms": timings}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--storage", choices=("json", "sqlite"), default="json")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", default="bench_screens.json")
+    parser.add_argument("--measure", metavar="RESULT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        timings = measure(args.repeat)
+        with open(args.measure, "w") as f:
+            json.dump({name: round(ms, 3) for name, ms in timings.items()}, f)
+        return
+
+    from PyQt6.QtCore import QT_VERSION_STR
+
+    report = {
+        "suite": "screens",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+        "storage": args.storage,
+        "repeat": args.repeat,
+        "runs": [],
+    }
+    for size in args.sizes:
+        run = run_size(size, args.storage, args.repeat)
+        report["runs"].append(run)
+        print(f"size {size}: generated in {run['generate_s']:.1f} s")
+        for name, ms in run["timings_ms"].items():
+            print(f"  {name:<48} {ms:>10.2f} ms")
+
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
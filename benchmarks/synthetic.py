@@ -0,0 +1,142 @@
+# benchmarks/synthetic.py
+"""Synthetic RIMWorks data at any scale, shaped like what the screens save.
+
+    python -m benchmarks.synthetic ROOT [--molds 1000] [--jobs 10000]
+        [--operators 200] [--calibrations 100] [--sqlite DB] [--seed 1]
+
+Fills a JSON data tree at ROOT (or a SQLite database with --sqlite) with
+molds, jobs, operators and calibrations. Generation is deterministic for a
+seed. Operators share one precomputed password hash (SYNTHETIC_PASSWORD),
+since hashing a million passwords would take hours.
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from backend.models.job import SNAPSHOT_FIELDS, STATUSES
+from backend.models.mixing_ratio import RATIO_LETTERS
+from backend.models.mold import mold_id_for
+
+SYSTEMS = ("Steering", "Braking", "Suspension", "Other")
+MOLD_TYPES = ("Soft Silicon", "Hard Silicon")
+CHEMICALS = ("A", "B", "C", "D")
+SYNTHETIC_PASSWORD = "12345678"
+EPOCH = datetime(2025, 1, 1)
+
+
+def synthetic_molds(count, seed=1):
+    """Mold records keyed by the storage key CreateMoldScreen would use."""
+    rng = random.Random(seed)
+    molds = {}
+    for i in range(count):
+        vehicle = f"Vehicle {i % 40}"
+        system = rng.choice(SYSTEMS)
+        created = EPOCH + timedelta(seconds=i * 37 + rng.randrange(30))
+        mold = {
+            "vehicle": vehicle,
+            "system": system,
+            "mold_name": f"{vehicle}_{system}",
+            "mold_type": rng.choice(MOLD_TYPES),
+            "mold_number": f"M{i:06d}",
+            "life_span": rng.randint(5, 50),
+            "part_number": f"{rng.randrange(10**9, 10**10)}",
+            "creation_type": rng.choice(["New part", "Previous mold life complete"]),
+            "mixing_ratio": rng.choice(RATIO_LETTERS),
+            "chemical_type": rng.choice(CHEMICALS),
+            "timestamp": created.strftime("%Y%m%d_%H%M%S"),
+        }
+        molds[mold_id_for(mold)] = mold
+    return molds
+
+
+def synthetic_operators(count, password_hash=None):
+    """Operator records, alternating Operator and Supervisor roles."""
+    operators = []
+    for i in range(count):
+        operator = {"username": f"operator{i}@rimworks", "name": f"Operator {i}",
+                    "epf_number": None, "role": ("Operator", "Supervisor")[i % 2]}
+        if password_hash:
+            operator["password_hash"] = password_hash
+        operators.append(operator)
+    return operators
+
+
+def synthetic_jobs(count, molds, operators, seed=1, embed_mold=False):
+    """Job records as SelectMoldScreen saves them, spread over a year.
+
+    embed_mold=True produces the older layout with a full mold copy.
+    """
+    rng = random.Random(seed)
+    mold_ids = list(molds)
+    for i in range(count):
+        mold_id = rng.choice(mold_ids)
+        mold = molds[mold_id]
+        operator = rng.choice(operators)
+        start = EPOCH + timedelta(minutes=rng.randrange(365 * 24 * 60))
+        job = {"job_id": f"JOB-{i:06X}",
+               "operator": {key: operator[key] for key in ("username", "name", "epf_number", "role")}}
+        if embed_mold:
+            job["mold"] = mold
+        else:
+            job["mold_id"] = mold_id
+            for field in SNAPSHOT_FIELDS:
+                job[field] = mold.get(field)
+        job["part_count"] = rng.randint(1, 50)
+        job["start_datetime"] = start.isoformat(timespec="seconds")
+        job["end_datetime"] = (start + timedelta(hours=rng.randint(1, 72))).isoformat(timespec="seconds")
+        job["status"] = rng.choice(STATUSES)
+        yield job
+
+
+def synthetic_calibrations(count, seed=1, start=EPOCH, span=timedelta(days=365)):
+    """Calibration records keyed as CalibrationMachineScreen saves them."""
+    rng = random.Random(seed)
+    calibrations = {}
+    for i in range(count):
+        saved = start + span * i / max(count, 1)
+        ranges = {}
+        for letter in RATIO_LETTERS:
+            low = round(rng.uniform(1, 10), 1)
+            ranges[letter] = {"min": low, "max": round(low + rng.uniform(0.5, 3), 1)}
+        calibrations[f"calibration_{saved:%Y%m%d_%H%M%S}"] = ranges
+    return calibrations
+
+
+def generate_tree(storage, molds=1000, jobs=10000, operators=200, calibrations=100, seed=1):
+    """Write a synthetic data set into a storage backend; returns the record counts."""
+    from backend.services.auth import hash_password
+
+    mold_records = synthetic_molds(molds, seed)
+    operator_records = synthetic_operators(operators, hash_password(SYNTHETIC_PASSWORD))
+    storage.save_many("molds", mold_records)
+    storage.save_many("operators", {op["username"]: op for op in operator_records})
+    storage.save_many("calibration", synthetic_calibrations(calibrations, seed))
+    batch = {}
+    for job in synthetic_jobs(jobs, mold_records, operator_records, seed):
+        batch[job["job_id"]] = job
+        if len(batch) >= 10000:
+            storage.save_many("jobs", batch)
+            batch = {}
+    storage.save_many("jobs", batch)
+    return {"molds": molds, "jobs": jobs, "operators": operators, "calibrations": calibrations}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", help="JSON data folder to fill")
+    parser.add_argument("--molds", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--operators", type=int, default=200)
+    parser.add_argument("--calibrations", type=int, default=100)
+    parser.add_argument("--sqlite", metavar="DB", help="write a SQLite database instead")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    from backend.services.file_handler import JsonStorage, SqliteStorage
+    storage = SqliteStorage(args.sqlite) if args.sqlite else JsonStorage(args.root)
+    counts = generate_tree(storage, args.molds, args.jobs, args.operators, args.calibrations, args.seed)
+    print(", ".join(f"{n} {kind}" for kind, n in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
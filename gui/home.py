@@ -1,5 +1,5 @@
 # gui/home.py
-from PyQt6.QtWidgets import QWidget, QStackedWidget, QVBoxLayout
+from PyQt6.QtWidgets import QWidget, QStackedWidget, QVBoxLayout, QMessageBox
 from gui.widgets.home_screen import HomeScreenUI
 from gui.engineer_dashboard import EngineerDashboard
 from gui.operator_dashboard import OperatorDashboard
@@ -12,12 +12,37 @@ from gui.widgets.view_mold_screen import ViewMoldScreen
 from gui.widgets.create_job_screen import CreateJobScreen
 from gui.widgets.select_mold_screen import SelectMoldScreen
 from gui.widgets.job_status_screen import JobStatusScreen  # NEW
+from backend.services.data_watcher import DataWatcher
+from backend.services.mold_catalog import get_mold_catalog
+from backend.services.job_manager import get_job_manager
+from backend.services.calibration_repository import get_calibration_repository
+from backend.services.instrumentation import ENABLED as METRICS_ENABLED, measure, start_metrics_dump
+from gui.widgets.metrics_overlay import MetricsOverlay
 
-import os, json, uuid
-from PyQt6.QtCore import Qt, QDateTime
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QKeySequence, QShortcut
+import os
 
 class HomeScreen(QWidget):
-    def __init__(self):
+    # Button -> target screen wiring, applied when a screen is first built
+    NAVIGATION = {
+        "home": {"engineer_btn": "engineer_login", "operator_btn": "operator_login"},
+        "engineer_dashboard": {
+            "create_operator_btn": "create_operator",
+            "create_mold_btn": "create_mold",
+            "create_job_btn": "create_job",
+            "calibration_btn": "calibration_machine",
+            "view_molds_btn": "view_mold_screen",
+            "job_status_btn": "job_status",
+            "back_btn": "home",
+        },
+        "operator_dashboard": {"back_btn": "home"},
+        "create_operator": {"back_btn": "engineer_dashboard"},
+        "create_mold": {"back_btn": "engineer_dashboard"},
+        "calibration_machine": {"back_btn": "engineer_dashboard"},
+    }
+
+    def __init__(self, prewarm=False):
         super().__init__()
         self.setWindowTitle("RIMWorks")
         self.setGeometry(400, 200, 600, 600)
@@ -29,108 +54,115 @@ class HomeScreen(QWidget):
         self.layout.addWidget(self.stack)
         self.setLayout(self.layout)
 
-        # Screens
-        self.home_ui = HomeScreenUI()
-        self.engineer_login_screen = EngineerLoginScreen()
-        self.operator_login_screen = OperatorLoginScreen()
-        self.engineer_dashboard = EngineerDashboard()
-        self.operator_dashboard = OperatorDashboard()
-        self.create_operator_screen = CreateOperatorScreen()
-        self.create_mold_screen = CreateMoldScreen()
-        self.calibration_machine_screen = CalibrationMachineScreen()
-        self.view_mold_screen = ViewMoldScreen(on_back=lambda: self.switch_screen("engineer_dashboard"))
-
-        self.create_job_screen = CreateJobScreen(
-            on_back=lambda: self.switch_screen("engineer_dashboard"),
-            on_next=self.goto_select_mold
-        )
-
-        self.job_status_screen = JobStatusScreen(on_back=lambda: self.switch_screen("engineer_dashboard"))
-
-        # Add base screens to stack
-        for screen in [
-            self.home_ui, self.engineer_login_screen, self.operator_login_screen,
-            self.engineer_dashboard, self.operator_dashboard,
-            self.create_operator_screen, self.create_mold_screen,
-            self.calibration_machine_screen, self.view_mold_screen,
-            self.create_job_screen, self.job_status_screen
-        ]:
+        # Screens are built (and load their data) on first navigation
+        back_to_dashboard = lambda: self.switch_screen("engineer_dashboard")
+        self.screen_factories = {
+            "home": HomeScreenUI,
+            "engineer_login": EngineerLoginScreen,
+            "operator_login": OperatorLoginScreen,
+            "engineer_dashboard": EngineerDashboard,
+            "operator_dashboard": OperatorDashboard,
+            "create_operator": CreateOperatorScreen,
+            "create_mold": CreateMoldScreen,
+            "calibration_machine": CalibrationMachineScreen,
+            "view_mold_screen": lambda: ViewMoldScreen(on_back=back_to_dashboard),
+            "create_job": lambda: CreateJobScreen(on_back=back_to_dashboard, on_next=self.goto_select_mold),
+            "job_status": lambda: JobStatusScreen(on_back=back_to_dashboard),
+            # one instance reused for every job, see goto_select_mold
+            "select_mold": lambda: SelectMoldScreen(
+                current_job={},
+                on_back=lambda: self.switch_screen("create_job"),
+                on_next=self.job_started
+            ),
+        }
+        self.screens = {}
+        self.switch_screen("home")
+
+        # --- Live updates from the shared data folders (after the window is up) ---
+        self.data_watcher = None
+        QTimer.singleShot(0, self.start_data_watcher)
+
+        # --- Jobs are saved in the background; failures surface here ---
+        get_job_manager(load=False).writer.failed.connect(self.job_save_failed)
+        get_job_manager(load=False).writer.rejected.connect(self.job_save_rejected)
+
+        # --- Timing overlay (F12) and metrics dump when RIMWORKS_METRICS=1 ---
+        self.metrics_overlay = None
+        if METRICS_ENABLED:
+            self.metrics_overlay = MetricsOverlay(self)
+            self.metrics_overlay.setVisible(os.environ.get("RIMWORKS_METRICS_OVERLAY") == "1")
+            QShortcut(QKeySequence("F12"), self, activated=self.metrics_overlay.toggle)
+            start_metrics_dump()
+
+        # --- Optionally build the remaining screens while the UI is idle ---
+        if prewarm:
+            QTimer.singleShot(0, self.prewarm_next_screen)
+
+    # ------------------- Screen registry -------------------
+    def screen(self, screen_name):
+        """Return a screen, building and wiring it on first use."""
+        screen = self.screens.get(screen_name)
+        if screen is None:
+            screen = self.screens[screen_name] = self.screen_factories[screen_name]()
             self.stack.addWidget(screen)
+            for button, target in self.NAVIGATION.get(screen_name, {}).items():
+                getattr(screen, button).clicked.connect(lambda _=False, t=target: self.switch_screen(t))
+            if screen_name == "engineer_login":
+                screen.login_btn.clicked.connect(self.engineer_login)
+            elif screen_name == "operator_login":
+                screen.login_btn.clicked.connect(self.operator_login)
+        return screen
+
+    def prewarm_next_screen(self):
+        """Build one not-yet-built screen per idle turn of the event loop."""
+        pending = [name for name in self.screen_factories if name not in self.screens]
+        if pending:
+            self.screen(pending[0])
+            QTimer.singleShot(0, self.prewarm_next_screen)
+
+    def start_data_watcher(self):
+        self.data_watcher = DataWatcher(parent=self)
+        self.data_watcher.changed.connect(self.on_data_changed)
 
-        # --- Home buttons ---
-        self.home_ui.engineer_btn.clicked.connect(lambda: self.switch_screen("engineer_login"))
-        self.home_ui.operator_btn.clicked.connect(lambda: self.switch_screen("operator_login"))
-
-        # --- Engineer login validation ---
-        self.engineer_login_screen.login_btn.clicked.connect(self.engineer_login)
-
-        # --- Operator login validation ---
-        self.operator_login_screen.login_btn.clicked.connect(self.operator_login)
-
-        # --- Engineer Dashboard navigation ---
-        self.engineer_dashboard.create_operator_btn.clicked.connect(
-            lambda: self.switch_screen("create_operator")
-        )
-        self.engineer_dashboard.create_mold_btn.clicked.connect(
-            lambda: self.switch_screen("create_mold")
-        )
-        self.engineer_dashboard.create_job_btn.clicked.connect(
-            lambda: self.switch_screen("create_job")
-        )
-        self.engineer_dashboard.calibration_btn.clicked.connect(
-            lambda: self.switch_screen("calibration_machine")
-        )
-        self.engineer_dashboard.view_molds_btn.clicked.connect(
-            lambda: self.switch_screen("view_mold_screen")
-        )
-        self.engineer_dashboard.job_status_btn.clicked.connect(  # add button in EngineerDashboard UI
-            lambda: self.switch_screen("job_status")
-        )
-        self.engineer_dashboard.back_btn.clicked.connect(lambda: self.switch_screen("home"))
-
-        # --- Operator Dashboard navigation ---
-        self.operator_dashboard.back_btn.clicked.connect(lambda: self.switch_screen("home"))
-
-        # --- Create Operator navigation ---
-        self.create_operator_screen.back_btn.clicked.connect(
-            lambda: self.switch_screen("engineer_dashboard")
-        )
-
-        # --- Create Mold navigation ---
-        self.create_mold_screen.back_btn.clicked.connect(
-            lambda: self.switch_screen("engineer_dashboard")
+    # ------------------- Screen switching -------------------
+    def switch_screen(self, screen_name):
+        if screen_name in self.screen_factories:
+            with measure(f"switch_screen.{screen_name}"):
+                # no rescan here: the data watcher and the job manager keep screens current
+                self.stack.setCurrentWidget(self.screen(screen_name))
+
+    def job_save_failed(self, keys, message):
+        QMessageBox.warning(
+            self, "Save failed",
+            f"Could not save job(s) {', '.join(keys)}:\n{message}\n\n"
+            "They stay queued and are retried with the next save."
         )
 
-        # --- Calibration Machine navigation ---
-        self.calibration_machine_screen.back_btn.clicked.connect(
-            lambda: self.switch_screen("engineer_dashboard")
+    def job_save_rejected(self, keys):
+        QMessageBox.warning(
+            self, "Job not saved",
+            f"Job id(s) {', '.join(keys)} are already in use by other jobs, "
+            "which were kept. Please create the job again."
         )
 
-    # ------------------- Screen switching -------------------
-    def switch_screen(self, screen_name):
-        mapping = {
-            "home": self.home_ui,
-            "engineer_login": self.engineer_login_screen,
-            "operator_login": self.operator_login_screen,
-            "engineer_dashboard": self.engineer_dashboard,
-            "operator_dashboard": self.operator_dashboard,
-            "create_operator": self.create_operator_screen,
-            "create_mold": self.create_mold_screen,
-            "calibration_machine": self.calibration_machine_screen,
-            "view_mold_screen": self.view_mold_screen,
-            "create_job": self.create_job_screen,
-            "job_status": self.job_status_screen
-        }
-        if screen_name in mapping:
-            self.stack.setCurrentWidget(mapping[screen_name])
-            # auto-refresh job status
-            if screen_name == "job_status":
-                self.job_status_screen.load_jobs()
+    # ------------------- Data folder changes -------------------
+    def on_data_changed(self, folder, changes):
+        """Route changed keys from the data watcher to the screens that exist."""
+        if folder == "jobs":
+            get_job_manager(load=False).apply_changes(changes)
+        elif folder == "molds":
+            get_mold_catalog(load=False).apply_changes(changes)
+        elif folder == "calibration":
+            get_calibration_repository(load=False).apply_changes(changes)
+        elif folder == "operators" and "create_job" in self.screens:
+            self.screens["create_job"].load_operators()
+            self.screens["create_job"].refresh_operator_list()
 
     # ------------------- Login handlers -------------------
     def engineer_login(self):
-        username = self.engineer_login_screen.username_input.text()
-        password = self.engineer_login_screen.password_input.text()
+        login_screen = self.screen("engineer_login")
+        username = login_screen.username_input.text()
+        password = login_screen.password_input.text()
         if username == "admin" and password == "admin123":
             print("Engineer login successful!")
             self.switch_screen("engineer_dashboard")
@@ -138,36 +170,24 @@ class HomeScreen(QWidget):
             print("Invalid engineer credentials!")
 
     def operator_login(self):
-        if self.operator_login_screen.validate_login():
+        if self.screen("operator_login").validate_login():
             print("Operator login successful!")
             self.switch_screen("operator_dashboard")
 
     # ------------------- Create Job → Select Mold flow -------------------
     def goto_select_mold(self, current_job):
         """Callback after operator assigned: open SelectMoldScreen."""
-        self.select_screen = SelectMoldScreen(
-            current_job=current_job,
-            on_back=lambda: self.switch_screen("create_job"),
-            on_next=self.job_started
-        )
-        self.stack.addWidget(self.select_screen)
-        self.stack.setCurrentWidget(self.select_screen)
+        select_screen = self.screen("select_mold")
+        select_screen.reset(current_job)
+        self.stack.setCurrentWidget(select_screen)
 
     def job_started(self, job_data):
         """Callback after Start Job pressed in SelectMoldScreen."""
-        print("Job started:", job_data)
-
-        # Ensure jobs folder exists
-        os.makedirs("data/jobs", exist_ok=True)
-
-        # Assign unique job_id if missing
-        if "job_id" not in job_data:
-            job_data["job_id"] = f"JOB-{uuid.uuid4().hex[:6].upper()}"
+        print("Job started:", job_data)  # already queued for saving by SelectMoldScreen
 
-        # Save job JSON
-        job_file = os.path.join("data/jobs", f"{job_data['job_id']}.json")
-        with open(job_file, "w") as f:
-            json.dump(job_data, f, indent=4)
+        # The next job starts from a clean operator step
+        if "create_job" in self.screens:
+            self.screens["create_job"].reset()
 
         # Navigate to Job Status screen
         self.switch_screen("job_status")
@@ -4,7 +4,8 @@ from PyQt6.QtWidgets import (
     QComboBox, QPushButton, QMessageBox
 )
 from PyQt6.QtCore import Qt
-import os, json
+from backend.services.file_handler import get_storage
+from backend.services.calibration_repository import get_calibration_repository
 from datetime import datetime
 
 class CalibrationMachineScreen(QWidget):
@@ -13,8 +14,8 @@ class CalibrationMachineScreen(QWidget):
     def __init__(self, on_back=None):
         super().__init__()
         self.on_back = on_back
-        self.data_folder = "data/calibration"
-        os.makedirs(self.data_folder, exist_ok=True)
+        self.storage = get_storage()
+        self.calibrations = get_calibration_repository()
         self.init_ui()
 
     def init_ui(self):
@@ -78,10 +79,10 @@ class CalibrationMachineScreen(QWidget):
             data[ratio] = {"min": min_val, "max": max_val}
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = os.path.join(self.data_folder, f"calibration_{timestamp}.json")
+        key = f"calibration_{timestamp}"
         try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=4)
-            QMessageBox.information(self, "Saved", f"Calibration saved:\n{file_path}")
+            self.storage.save("calibration", key, data)
+            self.calibrations.refresh()
+            QMessageBox.information(self, "Saved", f"Calibration saved:\n{key}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save calibration:\n{str(e)}")
@@ -4,9 +4,9 @@ from PyQt6.QtWidgets import (
     QListWidget, QPushButton, QMessageBox, QFrame
 )
 from PyQt6.QtCore import Qt
-import json
-import os
-from datetime import datetime
+from backend.services.file_handler import get_storage
+from gui.widgets.filter_pipeline import FilterPipeline
+from backend.services.instrumentation import timed
 
 class CreateJobScreen(QWidget):
     """Step 1 of Create Job: assign an operator.
@@ -25,13 +25,20 @@ class CreateJobScreen(QWidget):
         super().__init__()
         self.on_back = on_back
         self.on_next = on_next
-        self.operators_file = "data/operators/operators.json"
-        os.makedirs(os.path.dirname(self.operators_file), exist_ok=True)
+        self.storage = get_storage()
 
-        # current_job will collect partial job details across steps
-        self.current_job = {"job_id": self._generate_job_id()}
+        # current_job will collect partial job details across steps;
+        # its job_id is allocated when the job is started
+        self.current_job = {}
         self.operators = []            # loaded operator dictionaries
         self.selected_operator = None  # selected operator dict
+        # role/search/sort input -> filter + sort on a worker thread -> list
+        self.filter_pipeline = FilterPipeline(
+            collect=self.current_query,
+            query=self.filter_operators,
+            apply=self.show_operators,
+            parent=self
+        )
 
         self.init_ui()
         self.load_operators()
@@ -53,20 +60,20 @@ class CreateJobScreen(QWidget):
         filters = QHBoxLayout()
         self.role_select = QComboBox()
         self.role_select.addItems(self.ROLE_OPTIONS)
-        self.role_select.currentTextChanged.connect(self.refresh_operator_list)
+        self.role_select.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters.addWidget(QLabel("Operator Role:"))
         filters.addWidget(self.role_select)
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by username...")
-        self.search_input.textChanged.connect(self.refresh_operator_list)
+        self.search_input.textChanged.connect(lambda: self.filter_pipeline.request())
         filters.addWidget(QLabel("Search:"))
         filters.addWidget(self.search_input)
 
         # Optional sort selector (by username or name)
         self.sort_select = QComboBox()
         self.sort_select.addItems(["Sort: Username", "Sort: Name"])
-        self.sort_select.currentTextChanged.connect(self.refresh_operator_list)
+        self.sort_select.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters.addWidget(self.sort_select)
 
         main.addLayout(filters)
@@ -124,35 +131,29 @@ class CreateJobScreen(QWidget):
 
     # ---------------- Data Loading ----------------
     def load_operators(self):
-        """Load operators from JSON file safely."""
-        self.operators = []
-        if not os.path.exists(self.operators_file):
-            return
+        """Load operators from storage safely."""
         try:
-            with open(self.operators_file, "r") as f:
-                data = json.load(f)
-            if isinstance(data, list):
-                # Expecting list of dicts
-                for entry in data:
-                    if isinstance(entry, dict) and "username" in entry:
-                        self.operators.append(entry)
-            else:
-                # handle when file contains None or unexpected structure
-                print("Operators file has unexpected structure — ignoring.")
+            self.operators = list(self.storage.load_all("operators").values())
         except Exception as e:
             print(f"Failed to load operators: {e}")
-            # don't crash; operators stays empty
+            self.operators = []  # don't crash; operators stays empty
 
     # ---------------- List / Filter / Sort ----------------
     def refresh_operator_list(self):
         """Refresh the list widget based on role filter, search and sort."""
-        self.operator_list.clear()
-        role_filter = self.role_select.currentText()
-        q = self.search_input.text().strip().lower()
-        sort_mode = self.sort_select.currentText()
+        self.filter_pipeline.cancel()
+        self.show_operators(self.filter_operators(self.current_query()))
 
+    def current_query(self):
+        # self.operators is replaced, never mutated, so the worker can hold it
+        return (self.operators, self.role_select.currentText(),
+                self.search_input.text().strip().lower(), self.sort_select.currentText())
+
+    def filter_operators(self, params):
+        """Display lines for the operators matching a query; runs off the GUI thread."""
+        operators, role_filter, q, sort_mode = params
         filtered = []
-        for op in self.operators:
+        for op in operators:
             # role filter
             if role_filter != "All Roles" and op.get("role", "") != role_filter:
                 continue
@@ -167,10 +168,15 @@ class CreateJobScreen(QWidget):
         else:
             filtered.sort(key=lambda x: x.get("username", "").lower())
 
-        # populate list widget
-        for op in filtered:
-            display = f"{op.get('username','')}  —  {op.get('name','')}"
-            self.operator_list.addItem(display)
+        return [f"{op.get('username','')}  —  {op.get('name','')}" for op in filtered]
+
+    @timed("operator_list.rebuild")
+    def show_operators(self, lines):
+        # populate list widget in one batch
+        self.operator_list.setUpdatesEnabled(False)
+        self.operator_list.clear()
+        self.operator_list.addItems(lines)
+        self.operator_list.setUpdatesEnabled(True)
 
         # clear details & disable assignment until selection
         self.clear_details()
@@ -237,7 +243,11 @@ class CreateJobScreen(QWidget):
         else:
             QMessageBox.information(self, "Next", "Proceed to mold selection (not implemented).")
 
-    # ---------------- Utility ----------------
-    def _generate_job_id(self):
-        now = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"JOB_{now}"
+    def reset(self):
+        """Start collecting a new job (called once the previous one started)."""
+        self.current_job = {}
+        self.selected_operator = None
+        self.operator_list.clearSelection()
+        self.clear_details()
+        self.assign_btn.setEnabled(False)
+        self.next_btn.setEnabled(False)
@@ -4,7 +4,8 @@ from PyQt6.QtWidgets import (
     QSpinBox, QPushButton, QMessageBox
 )
 from PyQt6.QtCore import Qt
-import json, os, datetime
+from backend.services.mold_catalog import get_mold_catalog
+import datetime
 
 class CreateMoldScreen(QWidget):
     SYSTEMS = ["Steering", "Braking", "Suspension", "Other"]
@@ -14,8 +15,6 @@ class CreateMoldScreen(QWidget):
     def __init__(self, on_back=None):
         super().__init__()
         self.on_back = on_back
-        self.data_folder = "data/molds"
-        os.makedirs(self.data_folder, exist_ok=True)
         self.init_ui()
 
     def init_ui(self):
@@ -141,9 +140,7 @@ class CreateMoldScreen(QWidget):
             QMessageBox.warning(self, "Missing Info", "Please fill all mandatory fields.")
             return
 
-        # Save with timestamp
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_name = f"{mold_name}_{timestamp}.json"
 
         data = {
             "vehicle": vehicle,
@@ -160,9 +157,8 @@ class CreateMoldScreen(QWidget):
         }
 
         try:
-            file_path = os.path.join(self.data_folder, file_name)
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=4)
-            QMessageBox.information(self, "Success", f"Mold saved:\n{file_path}")
+            # the catalog gives the mold its id (also its file name) and indexes it
+            mold_id = get_mold_catalog().add(data)
+            QMessageBox.information(self, "Success", f"Mold saved:\n{mold_id}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save mold:\n{str(e)}")
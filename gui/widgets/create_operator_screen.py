@@ -1,14 +1,14 @@
 # gui/widgets/create_operator_screen.py
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QComboBox, QMessageBox
 from PyQt6.QtCore import Qt
-import os, json
+from backend.services.auth import hash_password
+from backend.services.file_handler import get_storage
 
 class CreateOperatorScreen(QWidget):
     def __init__(self, on_back=None):
         super().__init__()
         self.on_back = on_back
-        self.data_file = "data/operators/operators.json"
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+        self.storage = get_storage()
         self.init_ui()
 
     def init_ui(self):
@@ -96,22 +96,20 @@ class CreateOperatorScreen(QWidget):
             QMessageBox.warning(self, "Missing Info", "Please fill all fields including EPF Number.")
             return
 
-        data = []
-        if os.path.exists(self.data_file):
-            with open(self.data_file, "r") as f:
-                data = json.load(f)
+        # usernames are the operator keys; saving would replace the existing one
+        if self.storage.load("operators", username) is not None:
+            QMessageBox.warning(self, "Username Taken",
+                                f"An operator with username '{username}' already exists.")
+            return
 
-        data.append({
+        self.storage.save("operators", username, {
             "name": name,
             "username": username,
-            "password": password,
+            "password_hash": hash_password(password),
             "epf_number": epf_number,
             "role": role
         })
 
-        with open(self.data_file, "w") as f:
-            json.dump(data, f, indent=4)
-
         QMessageBox.information(self, "Success", f"Operator '{name}' saved successfully!")
 
         # Clear inputs
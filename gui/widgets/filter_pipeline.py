@@ -0,0 +1,80 @@
+# gui/widgets/filter_pipeline.py
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from backend.services.instrumentation import count, measure
+
+
+class _QueryTask(QRunnable):
+    def __init__(self, pipeline, generation, query, params):
+        super().__init__()
+        self.pipeline = pipeline
+        self.generation = generation
+        self.query = query
+        self.params = params
+
+    def run(self):
+        try:
+            with measure("filter.query"):
+                result = self.query(self.params)
+        except Exception as e:
+            print(f"Filter query failed: {e}")
+            result = None
+        try:
+            self.pipeline.finished.emit(self.generation, result)
+        except RuntimeError:
+            pass  # screen was destroyed while the query ran
+
+
+class FilterPipeline(QObject):
+    """Debounced, off-thread search/filter runner shared by list screens.
+
+    request() (re)starts a short timer, so a burst of keystrokes becomes one
+    query. When it fires, collect() reads the inputs on the GUI thread and
+    query(params) runs on the global QThreadPool. Only the newest query's
+    result reaches apply(), back on the GUI thread, which fills the list in
+    one batch; results of superseded queries are dropped.
+    """
+
+    # generation, result (None if the query failed)
+    finished = pyqtSignal(int, object)
+
+    def __init__(self, collect, query, apply, debounce_ms=150, parent=None):
+        super().__init__(parent)
+        self.collect = collect
+        self.query = query
+        self.apply = apply
+        self.debounce_ms = debounce_ms
+        self._generation = 0
+        self._in_flight = None  # generation of the newest dispatched query
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._dispatch)
+        self.finished.connect(self._on_finished)
+
+    @property
+    def pending(self):
+        """True while a requested result has not been applied yet."""
+        return self._timer.isActive() or self._in_flight == self._generation
+
+    def request(self, delay_ms=None):
+        self._timer.start(self.debounce_ms if delay_ms is None else delay_ms)
+
+    def cancel(self):
+        """Drop queued and running queries (e.g. before a synchronous refresh)."""
+        self._timer.stop()
+        self._generation += 1
+
+    def _dispatch(self):
+        self._generation += 1
+        self._in_flight = self._generation
+        task = _QueryTask(self, self._generation, self.query, self.collect())
+        QThreadPool.globalInstance().start(task)
+
+    def _on_finished(self, generation, result):
+        if generation != self._generation:
+            count("filter.stale_results")
+            return  # a newer query superseded this one
+        self._in_flight = None
+        if result is not None:
+            self.apply(result)
@@ -1,10 +1,15 @@
 # gui/widgets/job_status_screen.py
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
-    QPushButton, QHBoxLayout, QHeaderView
+    QWidget, QVBoxLayout, QLabel, QTableView,
+    QPushButton, QHBoxLayout, QHeaderView, QMessageBox, QCheckBox
 )
-from PyQt6.QtCore import Qt
-import os, json
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PyQt6.QtGui import QBrush, QColor
+from backend.models.job import NOT_STARTED, STATUSES
+from backend.services.job_manager import InvalidTransition, get_job_manager
+from backend.services.job_records import JobResolver
+from backend.services.instrumentation import timed
+import bisect
 
 STATUS_COLORS = {
     "Not Started": "#ff4d4d",    # Red
@@ -12,15 +17,234 @@ STATUS_COLORS = {
     "Completed": "#4dff4d"       # Green
 }
 
+# Pre-built brushes so data() never allocates colors per cell
+_STATUS_BRUSHES = {status: QBrush(QColor(color)) for status, color in STATUS_COLORS.items()}
+_DEFAULT_STATUS_BRUSH = QBrush(QColor("#ffffff"))
+_GROUP_BACKGROUND = QBrush(Qt.GlobalColor.darkGray)
+_GROUP_FOREGROUND = QBrush(Qt.GlobalColor.white)
+_STATUS_FOREGROUND = QBrush(Qt.GlobalColor.black)
+
+STATUS_COLUMN = 5
+
+# Batches larger than this reset the model instead of moving rows one by one
+RESET_ABOVE = 100
+
+# How often the "Running now only" view re-checks which jobs are running
+RUNNING_NOW_REFRESH_MS = 60_000
+
+
+class JobTableModel(QAbstractTableModel):
+    """Jobs grouped by chemical type, served lazily to a QTableView.
+
+    Each chemical type gets a header row followed by its jobs, sorted by
+    key. Only the group start rows are stored; data() maps a row to its
+    job with a binary search over them, so the view materializes visible
+    rows only. Small updates repaint, insert or remove just their rows, so
+    the view keeps its selection.
+    Job records are kept as compact Job models, grouped by the chemical
+    type they were planned with; mold name, vehicle and system are read
+    from the mold catalog through a JobResolver.
+    """
+
+    HEADERS = [
+        "Job ID", "Mold Name", "Vehicle", "System",
+        "Part Count", "Status", "Start Date/Time", "End Date/Time"
+    ]
+
+    MOLD_COLUMNS = {1: "mold_name", 2: "vehicle", 3: "system"}
+
+    def __init__(self, resolver=None, parent=None):
+        super().__init__(parent)
+        self.resolver = resolver or JobResolver()
+        self.jobs = {}          # key -> Job
+        self._groups = {}       # chemical type -> sorted list of job keys
+        self._group_of = {}     # job key -> chemical type
+        self._starts = []       # first row of each group, in display order
+        self._chemicals = []    # chemical type of each group, in display order
+        self._row_count = 0
+
+    # ---------------- Updates ----------------
+    @timed("job_table.apply")
+    def apply(self, updated, removed):
+        """Upsert jobs (key -> Job) and drop removed keys."""
+        if not self._row_count or len(updated) + len(removed) > RESET_ABOVE:
+            self._reload(updated, removed)
+            return
+        for key in removed:
+            if key in self._group_of:
+                self._remove_row(key)
+        for key, job in updated.items():
+            chem = job.chemical_type or "Unknown"
+            if self._group_of.get(key) == chem:
+                self.jobs[key] = job
+                row = self.row_of(key)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+                continue
+            if key in self._group_of:
+                self._remove_row(key)
+            self._insert_row(key, job, chem)
+
+    def _reload(self, updated, removed):
+        """apply() for large batches: regroup everything behind a model reset."""
+        self.beginResetModel()
+        moved = {}
+        for key, job in updated.items():
+            chem = job.chemical_type or "Unknown"
+            if self._group_of.get(key) != chem:
+                moved[key] = chem
+            self.jobs[key] = job
+        for key in [*removed, *moved]:
+            self._forget(key)
+        for key, chem in moved.items():
+            self._groups.setdefault(chem, []).append(key)
+            self._group_of[key] = chem
+            self.jobs[key] = updated[key]
+        for chem in set(moved.values()):
+            self._groups[chem].sort()
+        self._relayout()
+        self.endResetModel()
+
+    def _insert_row(self, key, job, chem):
+        keys = self._groups.get(chem)
+        if keys is None:
+            # a new group: its header row and the job row
+            i = bisect.bisect_left(self._chemicals, chem)
+            row = self._starts[i] if i < len(self._starts) else self._row_count
+            self.beginInsertRows(QModelIndex(), row, row + 1)
+            self._groups[chem] = [key]
+        else:
+            pos = bisect.bisect_left(keys, key)
+            row = self._group_start(chem) + 1 + pos
+            self.beginInsertRows(QModelIndex(), row, row)
+            keys.insert(pos, key)
+        self._group_of[key] = chem
+        self.jobs[key] = job
+        self._relayout()
+        self.endInsertRows()
+
+    def _remove_row(self, key):
+        row = self.row_of(key)
+        last_in_group = len(self._groups[self._group_of[key]]) == 1
+        self.beginRemoveRows(QModelIndex(), row - 1 if last_in_group else row, row)
+        self._forget(key)
+        self._relayout()
+        self.endRemoveRows()
+
+    def _forget(self, key):
+        self.jobs.pop(key, None)
+        chem = self._group_of.pop(key, None)
+        if chem is None:
+            return
+        keys = self._groups[chem]
+        del keys[bisect.bisect_left(keys, key)]
+        if not keys:
+            del self._groups[chem]
+
+    def molds_changed(self, changes):
+        """Repaint the mold columns after the catalog changed."""
+        if self._row_count:
+            self.dataChanged.emit(self.index(0, 1), self.index(self._row_count - 1, 3))
+
+    def _relayout(self):
+        self._starts = []
+        self._chemicals = sorted(self._groups)
+        row = 0
+        for chem in self._chemicals:
+            self._starts.append(row)
+            row += 1 + len(self._groups[chem])
+        self._row_count = row
+
+    def _group_start(self, chem):
+        return self._starts[bisect.bisect_left(self._chemicals, chem)]
+
+    def group_rows(self):
+        """Rows holding a "Chemical Type" header (to be spanned by the view)."""
+        return list(self._starts)
+
+    def row_of(self, key):
+        """Row showing a job key (the key must be in the model)."""
+        chem = self._group_of[key]
+        return self._group_start(chem) + 1 + bisect.bisect_left(self._groups[chem], key)
+
+    def key_at(self, row):
+        """Job key at a row (None for header rows)."""
+        i = bisect.bisect_right(self._starts, row) - 1
+        if i < 0:
+            return None
+        offset = row - self._starts[i]
+        return self._groups[self._chemicals[i]][offset - 1] if offset else None
+
+    def _locate(self, row):
+        """(chemical type, Job or None for the header row) at a row."""
+        i = bisect.bisect_right(self._starts, row) - 1
+        chem = self._chemicals[i]
+        offset = row - self._starts[i]
+        if offset == 0:
+            return chem, None
+        return chem, self.jobs[self._groups[chem][offset - 1]]
+
+    # ---------------- Qt model interface ----------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+
+        chem, job = self._locate(index.row())
+        col = index.column()
+        if job is None:
+            if role == Qt.ItemDataRole.DisplayRole and col == 0:
+                return f"Chemical Type: {chem}"
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return _GROUP_BACKGROUND
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return _GROUP_FOREGROUND
+            return None
+
+        status = job.status or NOT_STARTED
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return job.job_id or "N/A"
+            if col in self.MOLD_COLUMNS:
+                return self.resolver.mold_field(job, self.MOLD_COLUMNS[col]) or "N/A"
+            if col == 4:
+                return str(job.part_count)
+            if col == STATUS_COLUMN:
+                return status
+            if col == 6:
+                return job.start_datetime or "N/A"
+            return job.end_datetime or "N/A"
+        if col == STATUS_COLUMN:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return _STATUS_BRUSHES.get(status, _DEFAULT_STATUS_BRUSH)
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return _STATUS_FOREGROUND
+        return None
+
+
 class JobStatusScreen(QWidget):
     def __init__(self, on_back=None):
         super().__init__()
         self.on_back = on_back
-        self.data_folder = "data/jobs"
-        os.makedirs(self.data_folder, exist_ok=True)
-        self.jobs = []
+        self.manager = get_job_manager(load=False)
+        self.model = JobTableModel(self.manager.resolver, parent=self)
+        self.model.resolver.catalog.subscribe(self.model.molds_changed)
         self.init_ui()
-        self.load_jobs()
+        self.manager.subscribe(self.on_jobs_changed)
+        self.manager.writer.saved.connect(self.update_summary)
+        self.manager.ensure_loaded()
+        self.on_jobs_changed(None)  # whatever the manager already holds
 
     def init_ui(self):
         main = QVBoxLayout()
@@ -33,18 +257,16 @@ class JobStatusScreen(QWidget):
         title.setStyleSheet("font-size: 20px; font-weight: bold; color: #f0f0f0; padding: 6px;")
         main.addWidget(title)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "Job ID", "Mold Name", "Vehicle", "System",
-            "Part Count", "Status", "Start Date/Time", "End Date/Time"
-        ])
+        # Table (rows are served on demand by JobTableModel)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.table.setStyleSheet(
-            "QTableWidget {background-color: #2b2b2b; color: #f0f0f0; gridline-color: #444;}"
+            "QTableView {background-color: #2b2b2b; color: #f0f0f0; gridline-color: #444;}"
             "QHeaderView::section {background-color: #3c3f41; color: #f0f0f0; font-weight: bold;}"
         )
 
@@ -61,111 +283,98 @@ class JobStatusScreen(QWidget):
 
         main.addWidget(self.table)
 
+        # Status totals, read from the manager's running counters
+        self.summary_label = QLabel()
+        self.summary_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.summary_label.setStyleSheet("color: #f0f0f0; padding: 4px;")
+        main.addWidget(self.summary_label)
+
+        # Only jobs whose window contains the current time
+        self.running_now = QCheckBox("Running now only")
+        self.running_now.setStyleSheet("color: #f0f0f0;")
+        self.running_now.toggled.connect(self.running_now_toggled)
+        main.addWidget(self.running_now)
+
+        # Jobs start and end as time passes, not only when a job changes
+        self.running_now_timer = QTimer(self)
+        self.running_now_timer.setInterval(RUNNING_NOW_REFRESH_MS)
+        self.running_now_timer.timeout.connect(lambda: self.on_jobs_changed(None))
+
         # Buttons
         btn_layout = QHBoxLayout()
+        self.start_btn = QPushButton("▶️ Start Job")
+        self.start_btn.clicked.connect(lambda: self.advance_selected_job(self.manager.start))
+        self.complete_btn = QPushButton("✅ Complete Job")
+        self.complete_btn.clicked.connect(lambda: self.advance_selected_job(self.manager.complete))
         self.refresh_btn = QPushButton("🔄 Refresh")
         self.refresh_btn.clicked.connect(self.load_jobs)
         self.back_btn = QPushButton("⬅️ Back")
         self.back_btn.clicked.connect(self.on_back if self.on_back else lambda: None)
         btn_layout.addWidget(self.back_btn)
         btn_layout.addWidget(self.refresh_btn)
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.complete_btn)
         main.addLayout(btn_layout)
 
         self.setLayout(main)
 
     def load_jobs(self):
-        self.jobs = []
-        self.table.setRowCount(0)
+        """Pick up jobs added, changed or removed since the last load."""
+        self.manager.refresh()
 
-        # Load all jobs
-        for file in os.listdir(self.data_folder):
-            if not file.endswith(".json"):
-                continue
-            try:
-                with open(os.path.join(self.data_folder, file), "r") as f:
-                    data = json.load(f)
-                    self.jobs.append(data)
-            except Exception as e:
-                print(f"Failed to load job {file}: {e}")
-
-        # Group by chemical type
-        jobs_by_chemical = {}
-        for job in self.jobs:
-            chem = job.get("mold", {}).get("chemical_type", "Unknown")
-            if chem not in jobs_by_chemical:
-                jobs_by_chemical[chem] = []
-            jobs_by_chemical[chem].append(job)
-
-        # Fill table
-        for chem, jobs in sorted(jobs_by_chemical.items()):
-            # Insert chemical type as a spanning row
-            row_idx = self.table.rowCount()
-            self.table.insertRow(row_idx)
-            header_item = QTableWidgetItem(f"Chemical Type: {chem}")
-            header_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            header_item.setBackground(Qt.GlobalColor.darkGray)
-            header_item.setForeground(Qt.GlobalColor.white)
-            self.table.setItem(row_idx, 0, header_item)
-            self.table.setSpan(row_idx, 0, 1, self.table.columnCount())
-
-            for job in jobs:
-                row_idx = self.table.rowCount()
-                self.table.insertRow(row_idx)
-                mold = job.get("mold", {})
-                status = job.get("status", "Not Started")
-                color = STATUS_COLORS.get(status, "#ffffff")
-
-                cells = [
-                    job.get("job_id", "N/A"),
-                    mold.get("mold_name", "N/A"),
-                    mold.get("vehicle", "N/A"),
-                    mold.get("system", "N/A"),
-                    str(job.get("part_count", 0)),
-                    status,
-                    job.get("start_datetime", "N/A"),
-                    job.get("end_datetime", "N/A")
-                ]
-
-                for col, value in enumerate(cells):
-                    item = QTableWidgetItem(value)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    # Color status column
-                    if col == 5:
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.lightGray)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.lightGray)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.lightGray)
-                        # Apply status color
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                        item.setBackground(Qt.GlobalColor.transparent)
-                    self.table.setItem(row_idx, col, item)
+    def running_now_toggled(self, checked):
+        if checked:
+            self.running_now_timer.start()
+        else:
+            self.running_now_timer.stop()
+        self.on_jobs_changed(None)
+
+    def on_jobs_changed(self, changes):
+        """Patch the table from the manager (changes=None takes every job)."""
+        if self.running_now.isChecked():
+            running = self.manager.schedule.running_at()
+            updated = {key: self.manager.jobs[key] for key in running}
+            removed = [key for key in self.model.jobs if key not in updated]
+        elif changes is None:
+            updated = self.manager.jobs
+            removed = [key for key in self.model.jobs if key not in updated]
+        else:
+            updated = {key: self.manager.jobs[key] for key in changes.added + changes.modified}
+            removed = changes.removed
+        selected = self.selected_key()
+        self.model.apply(updated, removed)
+        if selected in self.model.jobs and not self.table.selectionModel().selectedRows():
+            self.table.selectRow(self.model.row_of(selected))  # large batches reset the model
+
+        # Chemical type headers span the full width
+        self.table.clearSpans()
+        for row in self.model.group_rows():
+            self.table.setSpan(row, 0, 1, self.model.columnCount())
+
+        self.update_summary()
+
+    def update_summary(self):
+        """Status totals, plus a note while job changes are still being saved."""
+        parts = [f"{status}: {self.manager.count('status', status)}" for status in STATUSES]
+        archived = self.manager.archived()
+        if archived:
+            parts.append(f"Archived: {archived}")
+        if self.manager.writer.busy:
+            parts.append("Saving…")
+        self.summary_label.setText("   |   ".join(parts))
+
+    def selected_key(self):
+        rows = self.table.selectionModel().selectedRows()
+        return self.model.key_at(rows[0].row()) if rows else None
+
+    def advance_selected_job(self, action):
+        key = self.selected_key()
+        if key is None:
+            QMessageBox.warning(self, "No selection", "Please select a job first.")
+            return
+        try:
+            action(key)
+        except InvalidTransition as e:
+            QMessageBox.warning(self, "Invalid status change", str(e))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to update job:\n{str(e)}")
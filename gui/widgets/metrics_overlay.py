@@ -0,0 +1,47 @@
+# gui/widgets/metrics_overlay.py
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt, QTimer
+
+from backend.services.instrumentation import metrics
+
+
+class MetricsOverlay(QLabel):
+    """Translucent p50/p95/p99 table of the slowest operations, drawn over
+    the top-right corner of its parent and refreshed once a second."""
+
+    def __init__(self, parent, rows=8, interval_ms=1000):
+        super().__init__(parent)
+        self.rows = rows
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 170); color: #7CFC00;"
+            "font-family: monospace; font-size: 10px; padding: 4px;"
+        )
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.update_text)
+
+    def showEvent(self, event):
+        self._timer.start()
+        self.update_text()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def update_text(self):
+        timings = metrics.snapshot()["timings"]
+        slowest = sorted(timings.items(), key=lambda item: item[1]["p95_ms"], reverse=True)
+        lines = [f"{'operation':<28}{'n':>6}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for name, t in slowest[:self.rows]:
+            lines.append(f"{name[:27]:<28}{t['count']:>6}{t['p50_ms']:>8.1f}"
+                         f"{t['p95_ms']:>8.1f}{t['p99_ms']:>8.1f}")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self.move(self.parent().width() - self.width() - 8, 8)
+        self.raise_()
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
@@ -1,13 +1,12 @@
 # gui/widgets/operator_login_screen.py
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton
 from PyQt6.QtCore import Qt
-import json
-import os
+from backend.services.auth import get_auth_service
 
 class OperatorLoginScreen(QWidget):
     def __init__(self):
         super().__init__()
-        self.data_file = "data/operators.json"
+        self.auth = get_auth_service()
         self.init_ui()
 
     def init_ui(self):
@@ -44,14 +43,7 @@ class OperatorLoginScreen(QWidget):
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
 
-        if not os.path.exists(self.data_file):
-            print("No operators registered yet!")
-            return False
-
-        with open(self.data_file, "r") as f:
-            operators = json.load(f)
-
-        match = next((op for op in operators if op["username"] == username and op["password"] == password), None)
+        match = self.auth.verify(username, password)
         if match:
             print(f"Login successful! Welcome, {match['name']}")
             return True
@@ -4,7 +4,10 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QDateTime
 from gui.widgets.view_mold_screen import ViewMoldScreen  # Your existing view screen
-import os, json, uuid
+from backend.models.job import NOT_STARTED, SNAPSHOT_FIELDS
+from backend.models.mold import mold_id_for
+from backend.services.id_allocator import get_job_ids
+from backend.services.job_manager import get_job_manager
 
 
 class SelectMoldScreen(QWidget):
@@ -14,7 +17,10 @@ class SelectMoldScreen(QWidget):
         self.on_back = on_back
         self.on_next = on_next
         self.selected_mold = None
+        self.selected_mold_id = None
+        self.view_screen = None           # mold picker, built on first use and reused
         self.init_ui()
+        get_job_ids().prefetch()          # so booking never waits on the sequence file
 
     # ---------------- UI Setup ----------------
     def init_ui(self):
@@ -67,22 +73,61 @@ class SelectMoldScreen(QWidget):
 
         self.setLayout(main)
 
+    # ---------------- Reset for a new job ----------------
+    def reset(self, current_job):
+        """Prepare the (reused) screen for the next job."""
+        self.current_job = current_job
+        self.selected_mold = None
+        self.selected_mold_id = None
+        self.selected_label.setText("Selected Mold: None")
+        self.part_count.setValue(1)
+        now = QDateTime.currentDateTime()
+        self.start_dt.setDateTime(now)
+        self.end_dt.setDateTime(now)
+        if self.view_screen is not None:
+            self.view_screen.hide()
+
     # ---------------- Open View Mold Screen ----------------
     def open_view_mold_screen(self):
-        # Callback when mold is selected in ViewMoldScreen
-        def mold_selected_callback(selected_data):
-            if selected_data:
-                self.selected_mold = selected_data
-                mold_name = selected_data.get("mold_name", "Unknown")
-                self.selected_label.setText(f"Selected Mold: {mold_name}")
-            self.view_screen.hide()
+        # One picker per screen; it shares the already-loaded mold catalog
+        if self.view_screen is None:
+            self.view_screen = ViewMoldScreen(
+                on_back=lambda: self.view_screen.hide(),
+                on_select=self.mold_selected
+            )
+        else:
+            self.view_screen.reset()
+        self.view_screen.show()
 
-        # Show ViewMoldScreen with selection callback
-        self.view_screen = ViewMoldScreen(
-            on_back=lambda: self.view_screen.hide(),
-            on_select=mold_selected_callback
+    # Callback when mold is selected in ViewMoldScreen
+    def mold_selected(self, selected_data, mold_id=None):
+        if selected_data:
+            self.selected_mold = selected_data
+            self.selected_mold_id = mold_id or mold_id_for(selected_data)
+            mold_name = selected_data.get("mold_name", "Unknown")
+            self.selected_label.setText(f"Selected Mold: {mold_name}")
+        self.view_screen.hide()
+
+    # ---------------- Double booking ----------------
+    def confirm_booking(self, start, end):
+        """True if the mold and operator are free in [start, end), or the user accepts the clash."""
+        operator = (self.current_job.get("operator") or {}).get("username")
+        manager = get_job_manager()  # kept current by the data watcher
+        conflicts = manager.schedule.conflicts(start, end, self.selected_mold_id, operator)
+        lines = []
+        for kind, label in (("mold", "Mold"), ("operator", "Operator")):
+            for key in conflicts[kind]:
+                job = manager.jobs[key]
+                lines.append(f"{label} already booked by {job.job_id or key} "
+                             f"({job.start_datetime} – {job.end_datetime})")
+        if not lines:
+            return True
+        reply = QMessageBox.question(
+            self, "Double booking",
+            "\n".join(lines) + "\n\nStart the job anyway?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
-        self.view_screen.show()
+        return reply == QMessageBox.StandardButton.Yes
 
     # ---------------- Start Job ----------------
     def start_job(self):
@@ -92,23 +137,28 @@ class SelectMoldScreen(QWidget):
         if self.start_dt.dateTime() >= self.end_dt.dateTime():
             QMessageBox.warning(self, "Invalid Date", "End date/time must be after start date/time.")
             return
+        start = self.start_dt.dateTime().toString(Qt.DateFormat.ISODate)
+        end = self.end_dt.dateTime().toString(Qt.DateFormat.ISODate)
+        if not self.confirm_booking(start, end):
+            return
 
-        # Generate unique job ID
-        job_id = f"JOB-{uuid.uuid4().hex[:6].upper()}"
+        job_ids = get_job_ids()
+        job_id = job_ids.next_id()
+        job_ids.prefetch()
 
         # Save job details
         self.current_job["job_id"] = job_id
-        self.current_job["mold"] = self.selected_mold
+        self.current_job.pop("mold", None)  # jobs reference the mold instead of copying it
+        self.current_job["mold_id"] = self.selected_mold_id
+        for field in SNAPSHOT_FIELDS:
+            self.current_job[field] = self.selected_mold.get(field)
         self.current_job["part_count"] = self.part_count.value()
-        self.current_job["start_datetime"] = self.start_dt.dateTime().toString(Qt.DateFormat.ISODate)
-        self.current_job["end_datetime"] = self.end_dt.dateTime().toString(Qt.DateFormat.ISODate)
-        self.current_job["status"] = "Not Started"  # default status
-
-        # Save to file
-        os.makedirs("data/jobs", exist_ok=True)
-        job_file = os.path.join("data/jobs", f"{job_id}.json")
-        with open(job_file, "w") as f:
-            json.dump(self.current_job, f, indent=4)
+        self.current_job["start_datetime"] = start
+        self.current_job["end_datetime"] = end
+        self.current_job["status"] = NOT_STARTED  # default status
+
+        # Queue the job; the manager's writer saves it off the GUI thread
+        get_job_manager().save(job_id, dict(self.current_job), create=True)
 
         # Callback or confirmation
         if self.on_next:
@@ -1,21 +1,40 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QLineEdit,
-    QListWidget, QPushButton, QMessageBox, QFrame
+    QListWidget, QListWidgetItem, QPushButton, QMessageBox, QFrame
 )
 from PyQt6.QtCore import Qt
-import json
-import os
+from backend.services.mold_catalog import get_mold_catalog
+from backend.services.job_manager import get_mold_usage
+from backend.services.instrumentation import timed
+from gui.widgets.filter_pipeline import FilterPipeline
+import bisect
+
+LIFE_FILTERS = ("Any Life", "Near End of Life", "Worn Out")
+SORT_MODES = ("Name", "Remaining Life ↑", "Remaining Life ↓")
 
 class ViewMoldScreen(QWidget):
     def __init__(self, on_back=None, on_select=None):
         super().__init__()
         self.on_back = on_back            # callback for back button
-        self.on_select = on_select        # callback for selecting a mold
-        self.data_folder = "data/molds"
-        os.makedirs(self.data_folder, exist_ok=True)
-        self.mold_files = []
+        self.on_select = on_select        # callback(mold dict, mold key) for selecting a mold
+        self.catalog = get_mold_catalog()
+        self.usage = get_mold_usage()     # parts produced per mold, from completed jobs
+        self.selected_mold_key = None
         self.selected_mold_data = None
+        self._row_sort_keys = []          # sort key of each list row, in row order
+        self._row_by_key = {}             # mold key -> sort key of its row
+        # filter/search input -> catalog query on a worker thread -> list
+        self.filter_pipeline = FilterPipeline(
+            collect=self.current_query,
+            query=self.query_results,
+            apply=self.show_results,
+            parent=self
+        )
         self.init_ui()
+        self.sync_filters()
+        self.refresh_mold_list()
+        self.catalog.subscribe(self.apply_catalog_changes)
+        self.usage.subscribe(self.apply_usage_changes)
         self.refresh_filters()
 
     def init_ui(self):
@@ -23,46 +42,42 @@ class ViewMoldScreen(QWidget):
         layout.setSpacing(15)
         layout.setContentsMargins(40, 20, 40, 20)
 
-        # --- Filters Row ---
+        # --- Filters Row (values and counts come from the catalog, see sync_filters) ---
         filters_layout = QHBoxLayout()
 
         self.vehicle_filter = QComboBox()
         self.vehicle_filter.addItem("All Vehicles")
-        self.vehicle_filter.currentTextChanged.connect(self.refresh_mold_list)
+        self.vehicle_filter.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters_layout.addWidget(QLabel("Vehicle:"))
         filters_layout.addWidget(self.vehicle_filter)
 
         self.system_filter = QComboBox()
         self.system_filter.addItem("All Systems")
-        self.system_filter.addItems(["Steering", "Braking", "Suspension", "Other"])
-        self.system_filter.currentTextChanged.connect(self.refresh_mold_list)
+        self.system_filter.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters_layout.addWidget(QLabel("System:"))
         filters_layout.addWidget(self.system_filter)
 
         self.mold_type_filter = QComboBox()
         self.mold_type_filter.addItem("All Mold Types")
-        self.mold_type_filter.addItems(["Soft Silicon", "Hard Silicon"])
-        self.mold_type_filter.currentTextChanged.connect(self.refresh_mold_list)
+        self.mold_type_filter.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters_layout.addWidget(QLabel("Mold Type:"))
         filters_layout.addWidget(self.mold_type_filter)
 
         self.chemical_filter = QComboBox()
         self.chemical_filter.addItem("All Chemicals")
-        self.chemical_filter.addItems(["A","B","C","D"])
-        self.chemical_filter.currentTextChanged.connect(self.refresh_mold_list)
+        self.chemical_filter.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters_layout.addWidget(QLabel("Chemical:"))
         filters_layout.addWidget(self.chemical_filter)
 
         self.mixing_filter = QComboBox()
         self.mixing_filter.addItem("All Mixing Ratios")
-        self.mixing_filter.addItems(["A","B","C","D","E","F","G","H","I","J"])
-        self.mixing_filter.currentTextChanged.connect(self.refresh_mold_list)
+        self.mixing_filter.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters_layout.addWidget(QLabel("Mixing Ratio:"))
         filters_layout.addWidget(self.mixing_filter)
 
         self.date_filter = QComboBox()
         self.date_filter.addItem("All Dates")
-        self.date_filter.currentTextChanged.connect(self.refresh_mold_list)
+        self.date_filter.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
         filters_layout.addWidget(QLabel("Date:"))
         filters_layout.addWidget(self.date_filter)
 
@@ -72,9 +87,21 @@ class ViewMoldScreen(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search Part Number...")
-        self.search_input.textChanged.connect(self.refresh_mold_list)
+        self.search_input.textChanged.connect(lambda: self.filter_pipeline.request())
         search_layout.addWidget(QLabel("Search:"))
         search_layout.addWidget(self.search_input)
+
+        self.life_filter = QComboBox()
+        self.life_filter.addItems(LIFE_FILTERS)
+        self.life_filter.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
+        search_layout.addWidget(QLabel("Life:"))
+        search_layout.addWidget(self.life_filter)
+
+        self.sort_select = QComboBox()
+        self.sort_select.addItems(SORT_MODES)
+        self.sort_select.currentTextChanged.connect(lambda: self.filter_pipeline.request(0))
+        search_layout.addWidget(QLabel("Sort:"))
+        search_layout.addWidget(self.sort_select)
         layout.addLayout(search_layout)
 
         # --- Mold List ---
@@ -109,55 +136,206 @@ class ViewMoldScreen(QWidget):
 
     # ------------------ Load filters ------------------
     def refresh_filters(self):
-        vehicles = set()
-        dates = set()
-        self.mold_files = [f for f in os.listdir(self.data_folder) if f.endswith(".json")]
-        for file in self.mold_files:
-            path = os.path.join(self.data_folder, file)
-            with open(path, "r") as f:
-                data = json.load(f)
-                vehicles.add(data.get("vehicle", ""))
-                date_created = data.get("created_at", "")
-                if date_created:
-                    dates.add(date_created)
-
-        # Update dropdowns
-        self.vehicle_filter.clear()
-        self.vehicle_filter.addItem("All Vehicles")
-        self.vehicle_filter.addItems(sorted(vehicles))
-
-        self.date_filter.clear()
-        self.date_filter.addItem("All Dates")
-        self.date_filter.addItems(sorted(dates))
+        """Rescan stored molds; changed molds arrive via apply_catalog_changes."""
+        self.catalog.refresh()
+
+    def filter_combos(self):
+        """(catalog field, dropdown) for every filter dropdown."""
+        return (
+            ("vehicle", self.vehicle_filter),
+            ("system", self.system_filter),
+            ("mold_type", self.mold_type_filter),
+            ("chemical_type", self.chemical_filter),
+            ("mixing_ratio", self.mixing_filter),
+            ("created_at", self.date_filter),
+        )
 
-        # Refresh list
+    def query_facets(self, params):
+        """Match counts per dropdown value for a query; safe off the GUI thread."""
+        filters, text, life_filter, _ = params
+        where = None if life_filter == LIFE_FILTERS[0] else (lambda key: self.life_matches(key, life_filter))
+        return self.catalog.facets(filters, text, where)
+
+    def sync_filters(self, facets=None):
+        """Give every dropdown the catalog's values, labelled with how many
+        molds each would match ("Steering (42)"); False if a selected value
+        disappeared."""
+        if facets is None:
+            facets = self.query_facets(self.current_query())
+        kept = True
+        for field, combo in self.filter_combos():
+            kept = self._sync_combo(combo, self.catalog.values(field), facets.get(field, {})) and kept
+        return kept
+
+    def _sync_combo(self, combo, values, counts):
+        current = combo.currentData()
+        wanted = set(values)
+        combo.blockSignals(True)
+        # index 0 is the "All ..." entry; the others hold their value as item data
+        for i in reversed(range(1, combo.count())):
+            if combo.itemData(i) not in wanted:
+                combo.removeItem(i)
+        existing = [combo.itemData(i) for i in range(1, combo.count())]
+        present = set(existing)
+        for value in values:
+            if value not in present:
+                pos = bisect.bisect_left(existing, value)
+                existing.insert(pos, value)
+                combo.insertItem(pos + 1, value, value)
+        for i, value in enumerate(existing, start=1):
+            combo.setItemText(i, f"{value} ({counts.get(value, 0)})")
+        if current is not None and current not in wanted:
+            combo.setCurrentIndex(0)
+        combo.blockSignals(False)
+        return combo.currentData() == current
+
+    def current_filters(self):
+        """Map the dropdown selections to catalog fields ("All ..." means no filter)."""
+        return {field: combo.currentData() for field, combo in self.filter_combos()
+                if combo.currentIndex() > 0}
+
+    def reset(self):
+        """Clear filters, search and selection so a reused picker starts fresh."""
+        for combo in [combo for _, combo in self.filter_combos()] + [self.life_filter, self.sort_select]:
+            combo.blockSignals(True)
+            combo.setCurrentIndex(0)
+            combo.blockSignals(False)
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+        self.selected_mold_key = None
+        self.selected_mold_data = None
         self.refresh_mold_list()
 
     # ------------------ Mold List ------------------
     def refresh_mold_list(self):
+        """Synchronous rebuild; typing and filter changes go through filter_pipeline."""
+        self.filter_pipeline.cancel()
+        self.show_results(self.query_results(self.current_query()))
+
+    def current_query(self):
+        return (self.current_filters(), self.search_input.text(),
+                self.life_filter.currentText(), self.sort_select.currentText())
+
+    def life_matches(self, key, life_filter):
+        if life_filter == "Near End of Life":
+            return self.usage.near_end_of_life(key)
+        if life_filter == "Worn Out":
+            return self.usage.worn_out(key)
+        return True
+
+    def row_sort_key(self, key, sort_mode):
+        if sort_mode == "Name":
+            return self.catalog.sort_key(key)
+        remaining = self.usage.remaining(key)
+        if remaining is None:
+            return (1, 0) + self.catalog.sort_key(key)   # untracked molds last
+        if sort_mode == "Remaining Life ↓":
+            remaining = -remaining
+        return (0, remaining) + self.catalog.sort_key(key)
+
+    def row_label(self, key):
+        name = self.catalog.get(key).get("mold_name")
+        remaining = self.usage.remaining(key)
+        if remaining is None:
+            return name
+        flag = "  ⚠" if self.usage.near_end_of_life(key) else ""
+        return f"{name}  —  {remaining}/{self.usage.life_span(key)} parts left{flag}"
+
+    def query_molds(self, params):
+        """(key, sort key, label) rows for a filter query; safe off the GUI thread."""
+        filters, text, life_filter, sort_mode = params
+        with self.catalog.lock:
+            rows = [(key, self.row_sort_key(key, sort_mode), self.row_label(key))
+                    for key in self.catalog.search(filters, text)
+                    if self.life_matches(key, life_filter)]
+        if sort_mode != "Name":
+            rows.sort(key=lambda row: row[1])
+        return rows
+
+    def query_results(self, params):
+        """List rows and dropdown counts for one query (run by filter_pipeline)."""
+        return self.query_molds(params), self.query_facets(params)
+
+    def show_results(self, results):
+        rows, facets = results
+        self.show_molds(rows)
+        if not self.sync_filters(facets):
+            self.filter_pipeline.request(0)  # a selected value is gone; query without it
+
+    @timed("mold_list.rebuild")
+    def show_molds(self, rows):
+        """Replace the list contents with query rows in one batch."""
+        self.mold_list_widget.setUpdatesEnabled(False)
         self.mold_list_widget.clear()
-        for file in self.mold_files:
-            path = os.path.join(self.data_folder, file)
-            with open(path, "r") as f:
-                data = json.load(f)
-
-            # Apply filters
-            if self.vehicle_filter.currentText() != "All Vehicles" and data.get("vehicle") != self.vehicle_filter.currentText():
-                continue
-            if self.system_filter.currentText() != "All Systems" and data.get("system") != self.system_filter.currentText():
-                continue
-            if self.mold_type_filter.currentText() != "All Mold Types" and data.get("mold_type") != self.mold_type_filter.currentText():
-                continue
-            if self.chemical_filter.currentText() != "All Chemicals" and data.get("chemical_type") != self.chemical_filter.currentText():
-                continue
-            if self.mixing_filter.currentText() != "All Mixing Ratios" and data.get("mixing_ratio") != self.mixing_filter.currentText():
-                continue
-            if self.date_filter.currentText() != "All Dates" and data.get("created_at") != self.date_filter.currentText():
-                continue
-            if self.search_input.text().strip() and self.search_input.text().strip().lower() not in data.get("part_number", "").lower():
-                continue
-
-            self.mold_list_widget.addItem(data.get("mold_name"))
+        self._row_sort_keys = [sort_key for _, sort_key, _ in rows]
+        self._row_by_key = {key: sort_key for key, sort_key, _ in rows}
+        for key, _, name in rows:
+            item = QListWidgetItem(name)
+            item.setData(Qt.ItemDataRole.UserRole, key)
+            self.mold_list_widget.addItem(item)
+        self.mold_list_widget.setUpdatesEnabled(True)
+
+    def apply_catalog_changes(self, changes):
+        """Patch the dropdowns and list with a catalog ChangeSet instead of rebuilding."""
+        if not self.sync_filters():
+            self.refresh_mold_list()
+            return
+        if self.filter_pipeline.pending:
+            # the result on its way predates these changes; ask again
+            self.filter_pipeline.request(0)
+            return
+
+        for key in changes.removed + changes.modified:
+            self._take_item(key)
+            if key == self.selected_mold_key:
+                self.selected_mold_key = None
+                self.selected_mold_data = None
+
+        self._insert_matching(changes.added + changes.modified)
+
+    def apply_usage_changes(self, mold_ids):
+        """Re-place molds whose remaining life changed as jobs completed."""
+        if self.filter_pipeline.pending:
+            self.filter_pipeline.request(0)
+            return
+        mold_ids = [key for key in mold_ids if self.catalog.get(key) is not None]
+        selected = self.selected_mold_key
+        for key in mold_ids:
+            self._take_item(key)
+        self._insert_matching(mold_ids)
+        if selected in mold_ids and selected in self._row_by_key:
+            # keep the selection on the moved row (this also refreshes its details)
+            self.mold_list_widget.setCurrentRow(
+                bisect.bisect_left(self._row_sort_keys, self._row_by_key[selected]))
+        if self.life_filter.currentIndex() > 0:
+            self.sync_filters()  # the counts depend on remaining life too
+
+    def _insert_matching(self, keys):
+        filters, text, life_filter, _ = self.current_query()
+        for key in keys:
+            if self.catalog.matches(key, filters, text) and self.life_matches(key, life_filter):
+                self._insert_item(key)
+
+    def _make_item(self, key):
+        item = QListWidgetItem(self.row_label(key))
+        item.setData(Qt.ItemDataRole.UserRole, key)
+        return item
+
+    def _take_item(self, key):
+        sort_key = self._row_by_key.pop(key, None)
+        if sort_key is None:
+            return
+        row = bisect.bisect_left(self._row_sort_keys, sort_key)
+        del self._row_sort_keys[row]
+        self.mold_list_widget.takeItem(row)
+
+    def _insert_item(self, key):
+        sort_key = self.row_sort_key(key, self.sort_select.currentText())
+        row = bisect.bisect_left(self._row_sort_keys, sort_key)
+        self._row_sort_keys.insert(row, sort_key)
+        self._row_by_key[key] = sort_key
+        self.mold_list_widget.insertItem(row, self._make_item(key))
 
     # ------------------ Display Selected Mold ------------------
     def display_selected_mold(self):
@@ -171,16 +349,8 @@ class ViewMoldScreen(QWidget):
         if not selected_items:
             return
 
-        selected_name = selected_items[0].text()
-        self.selected_mold_data = None
-        for file in self.mold_files:
-            path = os.path.join(self.data_folder, file)
-            with open(path, "r") as f:
-                data = json.load(f)
-            if data.get("mold_name") == selected_name:
-                self.selected_mold_data = data
-                break
-
+        self.selected_mold_key = selected_items[0].data(Qt.ItemDataRole.UserRole)
+        self.selected_mold_data = self.catalog.get(self.selected_mold_key)
         if not self.selected_mold_data:
             return
 
@@ -188,6 +358,19 @@ class ViewMoldScreen(QWidget):
         for key, value in self.selected_mold_data.items():
             self.details_layout.addWidget(QLabel(f"{key}: {value}"))
 
+        # Life consumed by completed jobs
+        key = self.selected_mold_key
+        remaining = self.usage.remaining(key)
+        if remaining is not None:
+            self.details_layout.addWidget(QLabel(
+                f"parts produced: {self.usage.used_parts(key)}  "
+                f"({self.usage.percent_used(key):.0f}% of life, {remaining} left)"
+            ))
+            if self.usage.near_end_of_life(key):
+                warning = QLabel("⚠ Near end of life")
+                warning.setStyleSheet("color: #ffd633; font-weight: bold;")
+                self.details_layout.addWidget(warning)
+
     # ------------------ Delete Mold ------------------
     def delete_selected_mold(self):
         if not self.selected_mold_data:
@@ -199,11 +382,10 @@ class ViewMoldScreen(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            file_path = os.path.join(self.data_folder, f"{self.selected_mold_data.get('mold_name')}.json")
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            # one file delete; the catalog patches its indexes and this list
+            self.catalog.delete(self.selected_mold_data.get("mold_id") or self.selected_mold_key)
+            self.selected_mold_key = None
             self.selected_mold_data = None
-            self.refresh_filters()
             # Clear details layout
             for i in reversed(range(self.details_layout.count())):
                 widget = self.details_layout.itemAt(i).widget()
@@ -217,5 +399,5 @@ class ViewMoldScreen(QWidget):
             QMessageBox.warning(self, "No selection", "Please select a mold first.")
             return
         if self.on_select:
-            self.on_select(self.selected_mold_data)
+            self.on_select(self.selected_mold_data, self.selected_mold_key)
         self.hide()
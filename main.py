@@ -1,4 +1,5 @@
 # main.py
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
 from gui.home import HomeScreen
@@ -10,8 +11,10 @@ if __name__ == "__main__":
     with open("resources/style.qss", "r") as f:
         app.setStyleSheet(f.read())
 
-    # Launch HomeScreen (navigation controller)
-    window = HomeScreen()
+    # Launch HomeScreen (navigation controller). RIMWORKS_PREWARM=1 builds the
+    # other screens while idle; off by default, as that loads the job history
+    # on the GUI thread
+    window = HomeScreen(prewarm=os.environ.get("RIMWORKS_PREWARM") == "1")
     window.show()
 
     sys.exit(app.exec())